@@ -1,6 +1,7 @@
 #include <algorithm>
 #include <cstdio>
 #include <cstring>
+#include <hwy/targets.h>
 #include <map>
 #include <memory>
 #include <mutex>
@@ -15,6 +16,7 @@
 #include <string>
 #include <thread>
 #include <turbojpeg.h>
+#include <utility>
 #include <vector>
 
 #include <jxl/decode.h>
@@ -85,6 +87,31 @@ void *get_global_runner(size_t threads) {
   return global_runner.get();
 }
 
+// Read-only view over any object exporting the buffer protocol (bytes, bytearray,
+// memoryview, mmap). The export is held for the lifetime of the view, which keeps the
+// memory valid while the GIL is released; it must be destroyed with the GIL held.
+class BufferView {
+public:
+  explicit BufferView(nb::handle obj) {
+    if (PyObject_GetBuffer(obj.ptr(), &view_, PyBUF_SIMPLE) != 0) {
+      throw nb::python_error();
+    }
+  }
+
+  ~BufferView() { PyBuffer_Release(&view_); }
+
+  BufferView(const BufferView &) = delete;
+  BufferView &operator=(const BufferView &) = delete;
+  BufferView(BufferView &&) = delete;
+  BufferView &operator=(BufferView &&) = delete;
+
+  [[nodiscard]] const uint8_t *data() const { return static_cast<const uint8_t *>(view_.buf); }
+  [[nodiscard]] size_t size() const { return static_cast<size_t>(view_.len); }
+
+private:
+  Py_buffer view_{};
+};
+
 std::vector<uint8_t> extract_optional_bytes(const nb::handle &obj) {
   if (obj.is_none()) {
     return {};
@@ -94,18 +121,28 @@ std::vector<uint8_t> extract_optional_bytes(const nb::handle &obj) {
   return {ptr, ptr + size};
 }
 
-// NOLINTNEXTLINE(readability-function-cognitive-complexity)
-// NOLINTNEXTLINE(readability-function-cognitive-complexity,cppcoreguidelines-avoid-non-const-global-variables)
-nb::bytes encode_impl(nb::ndarray<uint8_t, nb::c_contig, nb::device::cpu> input,
-                      int effort,
-                      float distance,
-                      bool lossless,
-                      int decoding_speed,
-                      nb::handle exif,
-                      nb::handle xmp,
-                      nb::handle jumbf,
-                      void *shared_runner,
-                      void *shared_runner_mutex) {
+// Pixel input for the encoders. Declared const so read-only arrays (np.frombuffer over
+// bytes, np.load(mmap_mode="r"), arrays with writeable=False) are accepted as-is
+// instead of being rejected; C-contiguous arrays are never copied.
+using InputArray = nb::ndarray<const uint8_t, nb::c_contig, nb::device::cpu>;
+
+// A const ndarray also binds plain byte buffers (bytes, bytearray) as 1-D arrays.
+// Those are never pixel data, so keep rejecting them as the wrong type.
+void reject_flat_buffer(const InputArray &input) {
+  if (input.ndim() == 1) {
+    throw nb::type_error("Input must be a numpy array of shape (height, width, channels), "
+                         "not a flat byte buffer");
+  }
+}
+
+struct ImageDims {
+  size_t height;
+  size_t width;
+  size_t channels;
+};
+
+ImageDims image_dims(const InputArray &input) {
+  reject_flat_buffer(input);
   if (input.ndim() != 3) {
     throw std::invalid_argument("Input must be a 3D array (height, width, channels), got ndim=" +
                                 std::to_string(input.ndim()));
@@ -119,162 +156,345 @@ nb::bytes encode_impl(nb::ndarray<uint8_t, nb::c_contig, nb::device::cpu> input,
     throw std::invalid_argument("Input must have 3 (RGB) or 4 (RGBA) channels, got " +
                                 std::to_string(channels));
   }
+  return {height, width, channels};
+}
 
-  // Extract metadata bytes while GIL is held to avoid data races with Python GC
-  std::vector<uint8_t> exif_data = extract_optional_bytes(exif);
-  std::vector<uint8_t> xmp_data = extract_optional_bytes(xmp);
-  std::vector<uint8_t> jumbf_data = extract_optional_bytes(jumbf);
-  const bool has_metadata = !exif_data.empty() || !xmp_data.empty() || !jumbf_data.empty();
-
-  effort = std::clamp(effort, 1, 11);
-  decoding_speed = std::clamp(decoding_speed, 0, 4);
-  distance = lossless ? 0.0F : std::clamp(distance, 0.0F, 25.0F);
-
-  const auto *input_ptr = static_cast<const uint8_t *>(input.data());
-  const auto input_size = static_cast<size_t>(input.size() * sizeof(uint8_t));
-
-  std::vector<uint8_t> compressed;
-  {
-    nb::gil_scoped_release release;
-    // If a shared runner is provided, we must serialize access to it because
-    // JxlResizableParallelRunner is not thread-safe for concurrent calls.
-    // If no shared runner is provided (free functions), we use a global shared runner.
-    std::unique_lock<std::mutex> lock;
-
-    // NOLINTNEXTLINE(bugprone-branch-clone)
-    if (shared_runner_mutex != nullptr) {
-      lock = std::unique_lock<std::mutex>(*static_cast<std::mutex *>(shared_runner_mutex));
-    } else {
-      lock = std::unique_lock<std::mutex>(global_runner_mutex);
-    }
+// If a shared runner is provided, we must serialize access to it because
+// JxlResizableParallelRunner is not thread-safe for concurrent calls.
+// If no shared runner is provided (free functions), we use a global shared runner.
+std::unique_lock<std::mutex> lock_runner(void *shared_runner_mutex) {
+  if (shared_runner_mutex != nullptr) {
+    return std::unique_lock<std::mutex>(*static_cast<std::mutex *>(shared_runner_mutex));
+  }
+  return std::unique_lock<std::mutex>(global_runner_mutex);
+}
 
+// Resolves the runner once its mutex is held. A codec's runner is only read here, so a
+// close() that took the lock first is reported as such instead of leaving a dangling
+// pointer; the free functions (shared_runner == nullptr) use the global runner.
+void *locked_runner(JxlRunnerPtr *shared_runner, size_t threads) {
+  if (shared_runner == nullptr) {
+    return get_global_runner(threads);
+  }
+  if (*shared_runner == nullptr) {
+    throw std::runtime_error("Cannot use a closed JXL codec");
+  }
+  return shared_runner->get();
+}
 
-    // NOLINTNEXTLINE(misc-const-correctness)
-    void *runner = shared_runner;
-    if (runner == nullptr) {
-      runner = get_global_runner(suggest_threads(width, height));
-    }
+// Encoder/decoder instances are kept alongside each runner and reset between images
+// instead of being created and destroyed on every call. Like the runner, they are only
+// touched with the matching mutex held; the free functions share these global ones.
+// NOLINTNEXTLINE(cppcoreguidelines-avoid-non-const-global-variables)
+JxlEncoderPtr global_encoder;
+// NOLINTNEXTLINE(cppcoreguidelines-avoid-non-const-global-variables)
+JxlDecoderPtr global_decoder;
 
-    JxlEncoderPtr enc(JxlEncoderCreate(nullptr));
+JxlEncoder *reuse_encoder(JxlEncoderPtr *cached) {
+  JxlEncoderPtr &enc = cached != nullptr ? *cached : global_encoder;
+  if (enc == nullptr) {
+    enc.reset(JxlEncoderCreate(nullptr));
     if (enc == nullptr) {
       throw std::runtime_error("JxlEncoderCreate failed");
     }
+  } else {
+    JxlEncoderReset(enc.get());
+  }
+  return enc.get();
+}
 
-    if (runner != nullptr) {
-      if (JXL_ENC_SUCCESS !=
-          JxlEncoderSetParallelRunner(enc.get(), JxlResizableParallelRunner, runner)) {
-        throw std::runtime_error("JxlEncoderSetParallelRunner failed");
-      }
+JxlDecoder *reuse_decoder(JxlDecoderPtr *cached) {
+  JxlDecoderPtr &dec = cached != nullptr ? *cached : global_decoder;
+  if (dec == nullptr) {
+    dec.reset(JxlDecoderCreate(nullptr));
+    if (dec == nullptr) {
+      throw std::runtime_error("JxlDecoderCreate failed");
     }
+  } else {
+    JxlDecoderReset(dec.get());
+  }
+  return dec.get();
+}
 
-    if (has_metadata) {
-      if (JXL_ENC_SUCCESS != JxlEncoderUseBoxes(enc.get())) {
-        throw std::runtime_error("JxlEncoderUseBoxes failed");
-      }
+// A bytes object used directly as the encoder's output buffer, so the result reaches
+// Python without being copied out of a std::vector. Only the encoding thread touches it
+// until release(); creating, growing and trimming it briefly retake the GIL.
+class BytesBuffer {
+public:
+  explicit BytesBuffer(size_t size) {
+    const nb::gil_scoped_acquire acquire;
+    obj_ = PyBytes_FromStringAndSize(nullptr, static_cast<Py_ssize_t>(size));
+    if (obj_ == nullptr) {
+      PyErr_Clear();
+      throw std::bad_alloc();
     }
+  }
+
+  BytesBuffer(BytesBuffer &&other) noexcept : obj_(std::exchange(other.obj_, nullptr)) {}
+  BytesBuffer(const BytesBuffer &) = delete;
+  BytesBuffer &operator=(const BytesBuffer &) = delete;
+  BytesBuffer &operator=(BytesBuffer &&) = delete;
 
-    if (effort > 9) {
-      JxlEncoderAllowExpertOptions(enc.get());
+  ~BytesBuffer() {
+    if (obj_ != nullptr) {
+      const nb::gil_scoped_acquire acquire;
+      Py_DECREF(obj_);
     }
+  }
 
-    JxlEncoderFrameSettings *frame_settings = JxlEncoderFrameSettingsCreate(enc.get(), nullptr);
-    JxlEncoderFrameSettingsSetOption(frame_settings, JXL_ENC_FRAME_SETTING_EFFORT, effort);
-    JxlEncoderFrameSettingsSetOption(
-        frame_settings, JXL_ENC_FRAME_SETTING_DECODING_SPEED, decoding_speed);
+  uint8_t *data() { return reinterpret_cast<uint8_t *>(PyBytes_AS_STRING(obj_)); }
+  [[nodiscard]] size_t size() const { return static_cast<size_t>(PyBytes_GET_SIZE(obj_)); }
 
-    if (lossless) {
-      JxlEncoderSetFrameLossless(frame_settings, JXL_TRUE);
-    } else {
-      JxlEncoderSetFrameDistance(frame_settings, distance);
+  void resize(size_t size) {
+    const nb::gil_scoped_acquire acquire;
+    if (_PyBytes_Resize(&obj_, static_cast<Py_ssize_t>(size)) != 0) {
+      PyErr_Clear();
+      throw std::bad_alloc();
     }
+  }
 
-    JxlBasicInfo basic_info;
-    JxlEncoderInitBasicInfo(&basic_info);
-    basic_info.xsize = static_cast<uint32_t>(width);
-    basic_info.ysize = static_cast<uint32_t>(height);
-    basic_info.bits_per_sample = 8;
-    basic_info.uses_original_profile = JXL_TRUE;
-    if (channels == 4) {
-      basic_info.num_extra_channels = 1;
-      basic_info.alpha_bits = 8;
+  // Hands the bytes object to Python. Requires the GIL.
+  nb::bytes release() { return nb::steal<nb::bytes>(std::exchange(obj_, nullptr)); }
+
+private:
+  PyObject *obj_ = nullptr;
+};
+
+// Drains the encoder into `out`, doubling it whenever libjxl needs more room, then trims
+// it to the encoded size.
+void process_output(JxlEncoder *enc, BytesBuffer &out) {
+  uint8_t *next_out = out.data();
+  size_t avail_out = out.size();
+
+  JxlEncoderStatus status = JXL_ENC_NEED_MORE_OUTPUT;
+  while (status == JXL_ENC_NEED_MORE_OUTPUT) {
+    status = JxlEncoderProcessOutput(enc, &next_out, &avail_out);
+    if (status == JXL_ENC_NEED_MORE_OUTPUT) {
+      const size_t offset = static_cast<size_t>(next_out - out.data());
+      out.resize(out.size() * 2);
+      next_out = out.data() + offset;
+      avail_out = out.size() - offset;
     }
+  }
+  if (status != JXL_ENC_SUCCESS) {
+    throw std::runtime_error("JxlEncoderProcessOutput failed");
+  }
+  out.resize(static_cast<size_t>(next_out - out.data()));
+}
+
+// Encodes one interleaved 8-bit image with a freshly reset encoder. Called with the GIL
+// released and the runner's mutex held.
+// NOLINTNEXTLINE(readability-function-cognitive-complexity,bugprone-easily-swappable-parameters)
+BytesBuffer encode_pixels(JxlEncoder *enc,
+                          void *runner,
+                          const uint8_t *input_ptr,
+                          const ImageDims &dims,
+                          int effort,
+                          float distance,
+                          bool lossless,
+                          int decoding_speed,
+                          const std::vector<uint8_t> &exif_data,
+                          const std::vector<uint8_t> &xmp_data,
+                          const std::vector<uint8_t> &jumbf_data) {
+  const auto [height, width, channels] = dims;
+  const size_t input_size = height * width * channels;
+  const bool has_metadata = !exif_data.empty() || !xmp_data.empty() || !jumbf_data.empty();
 
-    if (JXL_ENC_SUCCESS != JxlEncoderSetBasicInfo(enc.get(), &basic_info)) {
-      throw std::runtime_error("JxlEncoderSetBasicInfo failed");
+  if (runner != nullptr) {
+    if (JXL_ENC_SUCCESS != JxlEncoderSetParallelRunner(enc, JxlResizableParallelRunner, runner)) {
+      throw std::runtime_error("JxlEncoderSetParallelRunner failed");
     }
+  }
 
-    JxlColorEncoding color_encoding = {};
-    JxlColorEncodingSetToSRGB(&color_encoding, JXL_FALSE);
-    if (JXL_ENC_SUCCESS != JxlEncoderSetColorEncoding(enc.get(), &color_encoding)) {
-      throw std::runtime_error("JxlEncoderSetColorEncoding failed");
+  if (has_metadata) {
+    if (JXL_ENC_SUCCESS != JxlEncoderUseBoxes(enc)) {
+      throw std::runtime_error("JxlEncoderUseBoxes failed");
     }
+  }
 
-    JxlPixelFormat pixel_format = {
-        static_cast<uint32_t>(channels), JXL_TYPE_UINT8, JXL_LITTLE_ENDIAN, 0};
+  if (effort > 9) {
+    JxlEncoderAllowExpertOptions(enc);
+  }
 
-    if (JXL_ENC_SUCCESS !=
-        JxlEncoderAddImageFrame(frame_settings, &pixel_format, input_ptr, input_size)) {
-      throw std::runtime_error("JxlEncoderAddImageFrame failed");
-    }
+  JxlEncoderFrameSettings *frame_settings = JxlEncoderFrameSettingsCreate(enc, nullptr);
+  JxlEncoderFrameSettingsSetOption(frame_settings, JXL_ENC_FRAME_SETTING_EFFORT, effort);
+  JxlEncoderFrameSettingsSetOption(
+      frame_settings, JXL_ENC_FRAME_SETTING_DECODING_SPEED, decoding_speed);
 
-    if (has_metadata) {
-      JxlEncoderCloseFrames(enc.get());
+  if (lossless) {
+    JxlEncoderSetFrameLossless(frame_settings, JXL_TRUE);
+  } else {
+    JxlEncoderSetFrameDistance(frame_settings, distance);
+  }
 
-      if (!exif_data.empty()) {
-        // EXIF box requires 4-byte TIFF header offset prefix (usually 0) to comply with JXL spec
-        std::vector<uint8_t> exif_box(4 + exif_data.size(), 0);
-        std::memcpy(exif_box.data() + 4, exif_data.data(), exif_data.size());
-        if (JXL_ENC_SUCCESS !=
-            JxlEncoderAddBox(enc.get(), "Exif", exif_box.data(), exif_box.size(), JXL_TRUE)) {
-          throw std::runtime_error("JxlEncoderAddBox(Exif) failed");
-        }
-      }
+  JxlBasicInfo basic_info;
+  JxlEncoderInitBasicInfo(&basic_info);
+  basic_info.xsize = static_cast<uint32_t>(width);
+  basic_info.ysize = static_cast<uint32_t>(height);
+  basic_info.bits_per_sample = 8;
+  basic_info.uses_original_profile = JXL_TRUE;
+  if (channels == 4) {
+    basic_info.num_extra_channels = 1;
+    basic_info.alpha_bits = 8;
+  }
 
-      if (!xmp_data.empty()) {
-        if (JXL_ENC_SUCCESS !=
-            JxlEncoderAddBox(enc.get(), "xml ", xmp_data.data(), xmp_data.size(), JXL_TRUE)) {
-          throw std::runtime_error("JxlEncoderAddBox(XMP) failed");
-        }
+  if (JXL_ENC_SUCCESS != JxlEncoderSetBasicInfo(enc, &basic_info)) {
+    throw std::runtime_error("JxlEncoderSetBasicInfo failed");
+  }
+
+  JxlColorEncoding color_encoding = {};
+  JxlColorEncodingSetToSRGB(&color_encoding, JXL_FALSE);
+  if (JXL_ENC_SUCCESS != JxlEncoderSetColorEncoding(enc, &color_encoding)) {
+    throw std::runtime_error("JxlEncoderSetColorEncoding failed");
+  }
+
+  JxlPixelFormat pixel_format = {
+      static_cast<uint32_t>(channels), JXL_TYPE_UINT8, JXL_LITTLE_ENDIAN, 0};
+
+  if (JXL_ENC_SUCCESS !=
+      JxlEncoderAddImageFrame(frame_settings, &pixel_format, input_ptr, input_size)) {
+    throw std::runtime_error("JxlEncoderAddImageFrame failed");
+  }
+
+  if (has_metadata) {
+    JxlEncoderCloseFrames(enc);
+
+    if (!exif_data.empty()) {
+      // EXIF box requires 4-byte TIFF header offset prefix (usually 0) to comply with JXL spec
+      std::vector<uint8_t> exif_box(4 + exif_data.size(), 0);
+      std::memcpy(exif_box.data() + 4, exif_data.data(), exif_data.size());
+      if (JXL_ENC_SUCCESS !=
+          JxlEncoderAddBox(enc, "Exif", exif_box.data(), exif_box.size(), JXL_TRUE)) {
+        throw std::runtime_error("JxlEncoderAddBox(Exif) failed");
       }
+    }
 
-      if (!jumbf_data.empty()) {
-        if (JXL_ENC_SUCCESS !=
-            JxlEncoderAddBox(enc.get(), "jumb", jumbf_data.data(), jumbf_data.size(), JXL_TRUE)) {
-          throw std::runtime_error("JxlEncoderAddBox(JUMBF) failed");
-        }
+    if (!xmp_data.empty()) {
+      if (JXL_ENC_SUCCESS !=
+          JxlEncoderAddBox(enc, "xml ", xmp_data.data(), xmp_data.size(), JXL_TRUE)) {
+        throw std::runtime_error("JxlEncoderAddBox(XMP) failed");
       }
+    }
 
-      JxlEncoderCloseBoxes(enc.get());
-    } else {
-      JxlEncoderCloseInput(enc.get());
-    }
-
-    const size_t estimated = std::max<size_t>(width * height * channels / 2, 4096);
-    compressed.resize(estimated);
-    uint8_t *next_out = compressed.data();
-    size_t avail_out = compressed.size();
-
-    JxlEncoderStatus status = JXL_ENC_NEED_MORE_OUTPUT;
-    while (status == JXL_ENC_NEED_MORE_OUTPUT) {
-      status = JxlEncoderProcessOutput(enc.get(), &next_out, &avail_out);
-      if (status == JXL_ENC_NEED_MORE_OUTPUT) {
-        const size_t offset = static_cast<size_t>(next_out - compressed.data());
-        compressed.resize(compressed.size() * 2);
-        next_out = compressed.data() + offset;
-        avail_out = compressed.size() - offset;
+    if (!jumbf_data.empty()) {
+      if (JXL_ENC_SUCCESS !=
+          JxlEncoderAddBox(enc, "jumb", jumbf_data.data(), jumbf_data.size(), JXL_TRUE)) {
+        throw std::runtime_error("JxlEncoderAddBox(JUMBF) failed");
       }
     }
-    if (status != JXL_ENC_SUCCESS) {
-      throw std::runtime_error("JxlEncoderProcessOutput failed");
+
+    JxlEncoderCloseBoxes(enc);
+  } else {
+    JxlEncoderCloseInput(enc);
+  }
+
+  BytesBuffer compressed(std::max<size_t>(width * height * channels / 2, 4096));
+  process_output(enc, compressed);
+  return compressed;
+}
+
+// NOLINTNEXTLINE(bugprone-easily-swappable-parameters)
+nb::bytes encode_impl(InputArray input,
+                      int effort,
+                      float distance,
+                      bool lossless,
+                      int decoding_speed,
+                      nb::handle exif,
+                      nb::handle xmp,
+                      nb::handle jumbf,
+                      JxlRunnerPtr *shared_runner,
+                      void *shared_runner_mutex,
+                      JxlEncoderPtr *encoder = nullptr) {
+  const ImageDims dims = image_dims(input);
+
+  // Extract metadata bytes while GIL is held to avoid data races with Python GC
+  std::vector<uint8_t> exif_data = extract_optional_bytes(exif);
+  std::vector<uint8_t> xmp_data = extract_optional_bytes(xmp);
+  std::vector<uint8_t> jumbf_data = extract_optional_bytes(jumbf);
+
+  effort = std::clamp(effort, 1, 11);
+  decoding_speed = std::clamp(decoding_speed, 0, 4);
+  distance = lossless ? 0.0F : std::clamp(distance, 0.0F, 25.0F);
+
+  const auto *input_ptr = static_cast<const uint8_t *>(input.data());
+
+  std::optional<BytesBuffer> compressed;
+  {
+    nb::gil_scoped_release release;
+    const auto lock = lock_runner(shared_runner_mutex);
+
+    void *runner = locked_runner(shared_runner, suggest_threads(dims.width, dims.height));
+
+    compressed.emplace(encode_pixels(reuse_encoder(encoder),
+                                     runner,
+                                     input_ptr,
+                                     dims,
+                                     effort,
+                                     distance,
+                                     lossless,
+                                     decoding_speed,
+                                     exif_data,
+                                     xmp_data,
+                                     jumbf_data));
+  }
+
+  return compressed->release();
+}
+
+// Encodes every image under a single GIL release and a single runner lock, so a batch
+// of small images pays the Python dispatch and lock handoff once instead of per image.
+// Images are encoded one after another; each one is parallelized by the runner.
+// NOLINTNEXTLINE(bugprone-easily-swappable-parameters)
+nb::list encode_many_impl(const std::vector<InputArray> &inputs,
+                          int effort,
+                          float distance,
+                          bool lossless,
+                          int decoding_speed,
+                          JxlRunnerPtr *shared_runner,
+                          void *shared_runner_mutex,
+                          JxlEncoderPtr *encoder = nullptr) {
+  std::vector<ImageDims> dims;
+  dims.reserve(inputs.size());
+  for (const auto &input : inputs) {
+    dims.push_back(image_dims(input));
+  }
+
+  effort = std::clamp(effort, 1, 11);
+  decoding_speed = std::clamp(decoding_speed, 0, 4);
+  distance = lossless ? 0.0F : std::clamp(distance, 0.0F, 25.0F);
+
+  const std::vector<uint8_t> no_box;
+  std::vector<BytesBuffer> compressed;
+  compressed.reserve(inputs.size());
+  {
+    nb::gil_scoped_release release;
+    const auto lock = lock_runner(shared_runner_mutex);
+
+    for (size_t i = 0; i < inputs.size(); ++i) {
+      void *runner = locked_runner(shared_runner, suggest_threads(dims[i].width, dims[i].height));
+      compressed.push_back(encode_pixels(reuse_encoder(encoder),
+                                         runner,
+                                         static_cast<const uint8_t *>(inputs[i].data()),
+                                         dims[i],
+                                         effort,
+                                         distance,
+                                         lossless,
+                                         decoding_speed,
+                                         no_box,
+                                         no_box,
+                                         no_box));
     }
-    compressed.resize(static_cast<size_t>(next_out - compressed.data()));
   }
 
-  return nb::bytes(reinterpret_cast<const char *>(compressed.data()), compressed.size());
+  nb::list result;
+  for (auto &data : compressed) {
+    result.append(data.release());
+  }
+  return result;
 }
 
 // NOLINTNEXTLINE(cppcoreguidelines-avoid-non-const-global-variables)
-nb::bytes encode(nb::ndarray<uint8_t, nb::c_contig, nb::device::cpu> input,
+nb::bytes encode(InputArray input,
                  int effort = 7,
                  float distance = 1.0F,
                  bool lossless = false,
@@ -286,165 +506,173 @@ nb::bytes encode(nb::ndarray<uint8_t, nb::c_contig, nb::device::cpu> input,
       input, effort, distance, lossless, decoding_speed, exif, xmp, jumbf, nullptr, nullptr);
 }
 
-// NOLINTNEXTLINE(readability-function-cognitive-complexity)
-// NOLINTNEXTLINE(readability-function-cognitive-complexity,bugprone-easily-swappable-parameters,cppcoreguidelines-avoid-non-const-global-variables)
-nb::object
+nb::list encode_many(const std::vector<InputArray> &inputs,
+                     int effort = 7,
+                     float distance = 1.0F,
+                     bool lossless = false,
+                     int decoding_speed = 0) {
+  return encode_many_impl(inputs, effort, distance, lossless, decoding_speed, nullptr, nullptr);
+}
 
-// NOLINTNEXTLINE(readability-function-cognitive-complexity,bugprone-easily-swappable-parameters)
-decode_impl(nb::bytes data, bool metadata, void *shared_runner, void *shared_runner_mutex) {
-  char *raw_ptr = nullptr; // NOLINT(misc-const-correctness)
-  Py_ssize_t raw_size = 0;
-  if (PyBytes_AsStringAndSize(data.ptr(), &raw_ptr, &raw_size) != 0) {
-    throw nb::python_error();
-  }
-  const auto *jxl_data = reinterpret_cast<const uint8_t *>(raw_ptr);
-  const auto jxl_size = static_cast<size_t>(raw_size);
+// Caller-provided destination for decoded pixels (the `out=` argument of decode).
+using OutArray = nb::ndarray<uint8_t, nb::ndim<3>, nb::c_contig, nb::device::cpu>;
 
-  JxlBasicInfo info;
+struct DecodedImage {
+  JxlBasicInfo info{};
   size_t channels = 0;
-  std::unique_ptr<uint8_t[]> temp_owner;
-  uint8_t *result_ptr_var = nullptr;
+  std::unique_ptr<uint8_t[]> pixels;
   std::map<std::string, std::vector<uint8_t>> boxes;
+};
 
-  {
-    nb::gil_scoped_release release;
-
-    std::unique_lock<std::mutex> lock;
-
-    // NOLINTNEXTLINE(bugprone-branch-clone)
-    if (shared_runner_mutex != nullptr) {
-      lock = std::unique_lock<std::mutex>(*static_cast<std::mutex *>(shared_runner_mutex));
-    } else {
-      lock = std::unique_lock<std::mutex>(global_runner_mutex);
+// Decodes one JXL codestream. Called with the GIL released and the runner's mutex held.
+// When tune_threads is set the (global) runner is resized to suit the image. When out is
+// given the pixels are written into it and image.pixels stays empty.
+// NOLINTNEXTLINE(readability-function-cognitive-complexity,bugprone-easily-swappable-parameters)
+DecodedImage decode_pixels(JxlDecoder *dec,
+                           void *runner,
+                           bool tune_threads,
+                           const uint8_t *jxl_data,
+                           size_t jxl_size,
+                           bool metadata,
+                           const OutArray *out = nullptr) {
+  DecodedImage image;
+  JxlBasicInfo &info = image.info;
+
+  if (runner != nullptr) {
+    if (JXL_DEC_SUCCESS != JxlDecoderSetParallelRunner(dec, JxlResizableParallelRunner, runner)) {
+      throw std::runtime_error("JxlDecoderSetParallelRunner failed");
     }
+  }
 
+  // NOLINTNEXTLINE(cppcoreguidelines-init-variables)
+  int events = JXL_DEC_BASIC_INFO | JXL_DEC_FULL_IMAGE | (metadata ? JXL_DEC_BOX : 0);
+  if (metadata) {
+    JxlDecoderSetDecompressBoxes(dec, JXL_TRUE);
+  }
+  if (JXL_DEC_SUCCESS != JxlDecoderSubscribeEvents(dec, events)) {
+    throw std::runtime_error("JxlDecoderSubscribeEvents failed");
+  }
 
-    // NOLINTNEXTLINE(misc-const-correctness)
-    void *runner = shared_runner;
-    if (runner == nullptr) {
-      runner = get_global_runner(0);
-    }
+  JxlDecoderSetInput(dec, jxl_data, jxl_size);
+  JxlDecoderCloseInput(dec);
 
-    JxlDecoderPtr dec(JxlDecoderCreate(nullptr));
-    if (dec == nullptr) {
-      throw std::runtime_error("JxlDecoderCreate failed");
-    }
+  JxlPixelFormat format = {};
+  std::string current_box_type;
+  std::vector<uint8_t> box_buffer;
+  constexpr size_t k_box_chunk_size = 65536;
 
-    if (runner != nullptr) {
-      if (JXL_DEC_SUCCESS !=
-          JxlDecoderSetParallelRunner(dec.get(), JxlResizableParallelRunner, runner)) {
-        throw std::runtime_error("JxlDecoderSetParallelRunner failed");
-      }
-    }
+  for (;;) {
+    JxlDecoderStatus status = JxlDecoderProcessInput(dec);
 
-    // NOLINTNEXTLINE(cppcoreguidelines-init-variables)
-    int events = JXL_DEC_BASIC_INFO | JXL_DEC_FULL_IMAGE | (metadata ? JXL_DEC_BOX : 0);
-    if (metadata) {
-      JxlDecoderSetDecompressBoxes(dec.get(), JXL_TRUE);
+    if (status == JXL_DEC_ERROR) {
+      throw std::runtime_error("Decoder error during pixel decode");
     }
-    if (JXL_DEC_SUCCESS != JxlDecoderSubscribeEvents(dec.get(), events)) {
-      throw std::runtime_error("JxlDecoderSubscribeEvents failed");
+    if (status == JXL_DEC_NEED_MORE_INPUT) {
+      throw std::runtime_error("Truncated JXL data: need more input for pixels");
     }
-
-    JxlDecoderSetInput(dec.get(), jxl_data, jxl_size);
-    JxlDecoderCloseInput(dec.get());
-
-    JxlPixelFormat format = {};
-    std::string current_box_type;
-    std::vector<uint8_t> box_buffer;
-    constexpr size_t k_box_chunk_size = 65536;
-
-    for (;;) {
-      JxlDecoderStatus status = JxlDecoderProcessInput(dec.get());
-
-      if (status == JXL_DEC_ERROR) {
-        throw std::runtime_error("Decoder error during pixel decode");
+    if (status == JXL_DEC_BASIC_INFO) {
+      if (JXL_DEC_SUCCESS != JxlDecoderGetBasicInfo(dec, &info)) {
+        throw std::runtime_error("JxlDecoderGetBasicInfo failed");
       }
-      if (status == JXL_DEC_NEED_MORE_INPUT) {
-        throw std::runtime_error("Truncated JXL data: need more input for pixels");
+      if (tune_threads) {
+        JxlResizableParallelRunnerSetThreads(runner, suggest_threads(info.xsize, info.ysize));
       }
-      if (status == JXL_DEC_BASIC_INFO) {
-        if (JXL_DEC_SUCCESS != JxlDecoderGetBasicInfo(dec.get(), &info)) {
-          throw std::runtime_error("JxlDecoderGetBasicInfo failed");
-        }
-        if (shared_runner == nullptr) {
-          JxlResizableParallelRunnerSetThreads(runner, suggest_threads(info.xsize, info.ysize));
+      image.channels = info.num_color_channels + (info.alpha_bits > 0 ? 1 : 0);
+      format = {static_cast<uint32_t>(image.channels), JXL_TYPE_UINT8, JXL_LITTLE_ENDIAN, 0};
+      continue;
+    }
+    if (status == JXL_DEC_NEED_IMAGE_OUT_BUFFER) {
+      const size_t result_bytes = static_cast<size_t>(info.ysize * info.xsize * image.channels);
+      uint8_t *dest = nullptr;
+      if (out != nullptr) {
+        if (out->shape(0) != info.ysize || out->shape(1) != info.xsize ||
+            out->shape(2) != image.channels) {
+          throw std::invalid_argument(
+              "out has shape (" + std::to_string(out->shape(0)) + ", " +
+              std::to_string(out->shape(1)) + ", " + std::to_string(out->shape(2)) +
+              "), but the decoded image is (" + std::to_string(info.ysize) + ", " +
+              std::to_string(info.xsize) + ", " + std::to_string(image.channels) + ")");
         }
-        channels = info.num_color_channels + (info.alpha_bits > 0 ? 1 : 0);
-        format = {static_cast<uint32_t>(channels), JXL_TYPE_UINT8, JXL_LITTLE_ENDIAN, 0};
-        continue;
+        dest = out->data();
+      } else {
+        image.pixels.reset(new uint8_t[result_bytes]);
+        dest = image.pixels.get();
       }
-      if (status == JXL_DEC_NEED_IMAGE_OUT_BUFFER) {
-        const size_t result_bytes = static_cast<size_t>(info.ysize * info.xsize * channels);
-        temp_owner.reset(new uint8_t[result_bytes]);
-        result_ptr_var = temp_owner.get();
-        if (JXL_DEC_SUCCESS !=
-            JxlDecoderSetImageOutBuffer(dec.get(), &format, result_ptr_var, result_bytes)) {
-          throw std::runtime_error("JxlDecoderSetImageOutBuffer failed");
-        }
-        continue;
+      if (JXL_DEC_SUCCESS != JxlDecoderSetImageOutBuffer(dec, &format, dest, result_bytes)) {
+        throw std::runtime_error("JxlDecoderSetImageOutBuffer failed");
       }
-      if (status == JXL_DEC_BOX) {
-        if (!current_box_type.empty()) {
-          size_t remaining = JxlDecoderReleaseBoxBuffer(dec.get());
-          box_buffer.resize(box_buffer.size() - remaining);
-          boxes[current_box_type] = std::move(box_buffer);
-          current_box_type.clear();
-        }
-
-        JxlBoxType box_type{};
-        if (JXL_DEC_SUCCESS != JxlDecoderGetBoxType(dec.get(), box_type, JXL_TRUE)) {
-          continue;
-        }
-        std::string type_str(box_type, 4);
-
-        if (type_str == "Exif" || type_str == "xml " || type_str == "jumb") {
-          current_box_type = type_str;
-          box_buffer.resize(k_box_chunk_size);
-          JxlDecoderSetBoxBuffer(dec.get(), box_buffer.data(), box_buffer.size());
-        }
-        continue;
+      continue;
+    }
+    if (status == JXL_DEC_BOX) {
+      if (!current_box_type.empty()) {
+        size_t remaining = JxlDecoderReleaseBoxBuffer(dec);
+        box_buffer.resize(box_buffer.size() - remaining);
+        image.boxes[current_box_type] = std::move(box_buffer);
+        current_box_type.clear();
       }
-      if (status == JXL_DEC_BOX_NEED_MORE_OUTPUT) {
-        size_t remaining = JxlDecoderReleaseBoxBuffer(dec.get());
-        size_t bytes_read = box_buffer.size() - remaining;
-        box_buffer.resize(box_buffer.size() + k_box_chunk_size);
-        JxlDecoderSetBoxBuffer(
-            dec.get(), box_buffer.data() + bytes_read, box_buffer.size() - bytes_read);
+
+      JxlBoxType box_type{};
+      if (JXL_DEC_SUCCESS != JxlDecoderGetBoxType(dec, box_type, JXL_TRUE)) {
         continue;
       }
-      if (status == JXL_DEC_FULL_IMAGE) {
-        if (!metadata) {
-          break;
-        }
-        continue;
+      std::string type_str(box_type, 4);
+
+      if (type_str == "Exif" || type_str == "xml " || type_str == "jumb") {
+        current_box_type = type_str;
+        box_buffer.resize(k_box_chunk_size);
+        JxlDecoderSetBoxBuffer(dec, box_buffer.data(), box_buffer.size());
       }
-      if (status == JXL_DEC_SUCCESS) {
-        if (!current_box_type.empty()) {
-          size_t remaining = JxlDecoderReleaseBoxBuffer(dec.get());
-          box_buffer.resize(box_buffer.size() - remaining);
-          boxes[current_box_type] = std::move(box_buffer);
-        }
+      continue;
+    }
+    if (status == JXL_DEC_BOX_NEED_MORE_OUTPUT) {
+      size_t remaining = JxlDecoderReleaseBoxBuffer(dec);
+      size_t bytes_read = box_buffer.size() - remaining;
+      box_buffer.resize(box_buffer.size() + k_box_chunk_size);
+      JxlDecoderSetBoxBuffer(dec, box_buffer.data() + bytes_read, box_buffer.size() - bytes_read);
+      continue;
+    }
+    if (status == JXL_DEC_FULL_IMAGE) {
+      if (!metadata) {
         break;
       }
-      // Continue for any other unhandled statuses
+      continue;
+    }
+    if (status == JXL_DEC_SUCCESS) {
+      if (!current_box_type.empty()) {
+        size_t remaining = JxlDecoderReleaseBoxBuffer(dec);
+        box_buffer.resize(box_buffer.size() - remaining);
+        image.boxes[current_box_type] = std::move(box_buffer);
+      }
+      break;
     }
+    // Continue for any other unhandled statuses
   }
+  return image;
+}
 
-  // NOLINTNEXTLINE(cppcoreguidelines-avoid-c-arrays,modernize-avoid-c-arrays)
-
-  // NOLINTNEXTLINE(cppcoreguidelines-avoid-c-arrays,modernize-avoid-c-arrays)
-  size_t shape[3] = {static_cast<size_t>(info.ysize), static_cast<size_t>(info.xsize), channels};
-  nb::capsule owner(result_ptr_var, [](void *p) noexcept { delete[] (uint8_t *)p; });
-  temp_owner.release();
-  nb::ndarray<uint8_t, nb::numpy, nb::device::cpu> result(result_ptr_var, 3, shape, owner);
+// Hands the decoded pixels over to a numpy array (and metadata dict). Needs the GIL.
+// If the pixels were decoded into a caller-provided array, that array is returned.
+nb::object wrap_decoded(DecodedImage &image, bool metadata, nb::handle out = nb::handle()) {
+  nb::object result;
+  if (out.is_valid()) {
+    result = nb::borrow(out);
+  } else {
+    // NOLINTNEXTLINE(cppcoreguidelines-avoid-c-arrays,modernize-avoid-c-arrays)
+    size_t shape[3] = {static_cast<size_t>(image.info.ysize),
+                       static_cast<size_t>(image.info.xsize),
+                       image.channels};
+    uint8_t *pixels = image.pixels.get();
+    nb::capsule owner(pixels, [](void *p) noexcept { delete[] (uint8_t *)p; });
+    image.pixels.release();
+    result = nb::cast(nb::ndarray<uint8_t, nb::numpy, nb::device::cpu>(pixels, 3, shape, owner));
+  }
 
   if (!metadata) {
-    return nb::cast(result);
+    return result;
   }
 
   nb::dict meta;
-  for (auto &[key, value] : boxes) {
+  for (auto &[key, value] : image.boxes) {
     if (key == "Exif" && value.size() > 4) {
       meta["exif"] = nb::bytes(reinterpret_cast<const char *>(value.data() + 4), value.size() - 4);
     } else if (key == "xml ") {
@@ -456,12 +684,89 @@ decode_impl(nb::bytes data, bool metadata, void *shared_runner, void *shared_run
   return nb::make_tuple(result, meta);
 }
 
-nb::object decode(nb::bytes data, bool metadata = false) {
-  return decode_impl(data, metadata, nullptr, nullptr);
+// NOLINTNEXTLINE(bugprone-easily-swappable-parameters)
+nb::object decode_impl(nb::handle data,
+                       bool metadata,
+                       nb::handle out,
+                       JxlRunnerPtr *shared_runner,
+                       void *shared_runner_mutex,
+                       JxlDecoderPtr *decoder = nullptr) {
+  const BufferView buffer(data);
+
+  // Decoding into a caller-owned array lets hot loops over same-sized images
+  // reuse one buffer instead of allocating (and page-faulting) a new one per call.
+  OutArray out_array;
+  const bool has_out = !out.is_none();
+  if (has_out && !nb::try_cast(out, out_array, false)) {
+    throw nb::type_error("out must be a writable C-contiguous uint8 array of shape (H, W, C)");
+  }
+
+  DecodedImage image;
+  {
+    nb::gil_scoped_release release;
+    const auto lock = lock_runner(shared_runner_mutex);
+
+    void *runner = locked_runner(shared_runner, 0);
+
+    image = decode_pixels(reuse_decoder(decoder),
+                          runner,
+                          shared_runner == nullptr,
+                          buffer.data(),
+                          buffer.size(),
+                          metadata,
+                          has_out ? &out_array : nullptr);
+  }
+
+  return wrap_decoded(image, metadata, has_out ? out : nb::handle());
+}
+
+// Decodes every blob under a single GIL release and a single runner lock.
+// NOLINTNEXTLINE(bugprone-easily-swappable-parameters)
+nb::list decode_many_impl(nb::sequence blobs,
+                          bool metadata,
+                          JxlRunnerPtr *shared_runner,
+                          void *shared_runner_mutex,
+                          JxlDecoderPtr *decoder = nullptr) {
+  std::vector<std::unique_ptr<BufferView>> buffers;
+  for (nb::handle blob : blobs) {
+    buffers.push_back(std::make_unique<BufferView>(blob));
+  }
+
+  std::vector<DecodedImage> images(buffers.size());
+  {
+    nb::gil_scoped_release release;
+    const auto lock = lock_runner(shared_runner_mutex);
+
+    void *runner = locked_runner(shared_runner, 0);
+
+    for (size_t i = 0; i < buffers.size(); ++i) {
+      images[i] = decode_pixels(reuse_decoder(decoder),
+                                runner,
+                                shared_runner == nullptr,
+                                buffers[i]->data(),
+                                buffers[i]->size(),
+                                metadata);
+    }
+  }
+
+  nb::list result;
+  for (auto &image : images) {
+    result.append(wrap_decoded(image, metadata));
+  }
+  return result;
+}
+
+nb::object decode(nb::handle data, bool metadata = false, nb::handle out = nb::none()) {
+  return decode_impl(data, metadata, out, nullptr, nullptr);
+}
+
+nb::list decode_many(nb::sequence blobs, bool metadata = false) {
+  return decode_many_impl(blobs, metadata, nullptr, nullptr);
 }
 
 // NOLINTNEXTLINE(cppcoreguidelines-avoid-non-const-global-variables)
-nb::bytes encode_jpeg(nb::ndarray<uint8_t, nb::c_contig, nb::device::cpu> input, int quality = 95) {
+nb::bytes encode_jpeg(InputArray input, int quality = 95) {
+  reject_flat_buffer(input);
   if (input.ndim() != 3) {
     throw std::invalid_argument("Input must be a 3D array (height, width, channels)");
   }
@@ -512,15 +817,10 @@ nb::bytes encode_jpeg(nb::ndarray<uint8_t, nb::c_contig, nb::device::cpu> input,
 }
 
 // NOLINTNEXTLINE(cppcoreguidelines-avoid-non-const-global-variables)
-nb::ndarray<uint8_t, nb::numpy, nb::device::cpu> decode_jpeg(nb::bytes data) {
-  char *raw_ptr = nullptr; // NOLINT
-  Py_ssize_t raw_size = 0;
-  if (PyBytes_AsStringAndSize(data.ptr(), &raw_ptr, &raw_size) != 0) {
-    throw nb::python_error();
-  }
-
-  const auto *jpeg_data = reinterpret_cast<const unsigned char *>(raw_ptr);
-  const auto jpeg_size = static_cast<unsigned long>(raw_size); // NOLINT
+nb::ndarray<uint8_t, nb::numpy, nb::device::cpu> decode_jpeg(nb::handle data) {
+  const BufferView buffer(data);
+  const unsigned char *jpeg_data = buffer.data();
+  const auto jpeg_size = static_cast<unsigned long>(buffer.size()); // NOLINT
 
   int width = 0;
   int height = 0;
@@ -570,148 +870,145 @@ nb::ndarray<uint8_t, nb::numpy, nb::device::cpu> decode_jpeg(nb::bytes data) {
   return nb::ndarray<uint8_t, nb::numpy, nb::device::cpu>(result_ptr_var, 3, shape, owner);
 }
 
-// NOLINTNEXTLINE(cppcoreguidelines-avoid-non-const-global-variables)
-// NOLINTNEXTLINE(bugprone-easily-swappable-parameters,cppcoreguidelines-avoid-non-const-global-variables)
-nb::bytes
-
+// Losslessly recompresses one JPEG. Called with the GIL released and the runner's
+// mutex held.
 // NOLINTNEXTLINE(bugprone-easily-swappable-parameters)
-jpeg_to_jxl(nb::bytes jpeg_data, int effort, void *shared_runner, void *shared_runner_mutex) {
-  char *raw_ptr = nullptr; // NOLINT
-  Py_ssize_t raw_size = 0;
-  if (PyBytes_AsStringAndSize(jpeg_data.ptr(), &raw_ptr, &raw_size) != 0) {
-    throw nb::python_error();
+BytesBuffer transcode_jpeg(
+    JxlEncoder *enc, void *runner, const uint8_t *jpeg_ptr, size_t jpeg_len, int effort) {
+  if (runner != nullptr) {
+    if (JXL_ENC_SUCCESS != JxlEncoderSetParallelRunner(enc, JxlResizableParallelRunner, runner)) {
+      throw std::runtime_error("JxlEncoderSetParallelRunner failed");
+    }
+  }
+
+  if (JXL_ENC_SUCCESS != JxlEncoderUseContainer(enc, JXL_TRUE)) {
+    throw std::runtime_error("JxlEncoderUseContainer failed");
+  }
+
+  if (JXL_ENC_SUCCESS != JxlEncoderStoreJPEGMetadata(enc, JXL_TRUE)) {
+    throw std::runtime_error("JxlEncoderStoreJPEGMetadata failed");
+  }
+
+  JxlEncoderFrameSettings *settings = JxlEncoderFrameSettingsCreate(enc, nullptr);
+  if (JXL_ENC_SUCCESS !=
+      JxlEncoderFrameSettingsSetOption(settings, JXL_ENC_FRAME_SETTING_EFFORT, effort)) {
+    throw std::runtime_error("JxlEncoderFrameSettingsSetOption(EFFORT) failed");
+  }
+
+  if (JXL_ENC_SUCCESS != JxlEncoderAddJPEGFrame(settings, jpeg_ptr, jpeg_len)) {
+    throw std::runtime_error("JxlEncoderAddJPEGFrame failed (input may not be a valid JPEG)");
   }
-  const auto *jpeg_ptr = reinterpret_cast<const uint8_t *>(raw_ptr);
-  const auto jpeg_len = static_cast<size_t>(raw_size);
+
+  JxlEncoderCloseInput(enc);
+
+  BytesBuffer compressed(jpeg_len + 4096);
+  process_output(enc, compressed);
+  return compressed;
+}
+
+// NOLINTNEXTLINE(bugprone-easily-swappable-parameters)
+nb::bytes jpeg_to_jxl(nb::handle jpeg_data,
+                      int effort,
+                      JxlRunnerPtr *shared_runner,
+                      void *shared_runner_mutex,
+                      JxlEncoderPtr *encoder = nullptr) {
+  const BufferView buffer(jpeg_data);
 
   effort = std::clamp(effort, 1, 11);
 
-  std::vector<uint8_t> compressed;
+  std::optional<BytesBuffer> compressed;
   {
     nb::gil_scoped_release release;
-    // If a shared runner is provided, we must serialize access to it because
-    // JxlResizableParallelRunner is not thread-safe for concurrent calls.
-    // If no shared runner is provided (free functions), we use a global shared runner.
-    std::unique_lock<std::mutex> lock;
-
-    // NOLINTNEXTLINE(bugprone-branch-clone)
-    if (shared_runner_mutex != nullptr) {
-      lock = std::unique_lock<std::mutex>(*static_cast<std::mutex *>(shared_runner_mutex));
-    } else {
-      lock = std::unique_lock<std::mutex>(global_runner_mutex);
-    }
+    const auto lock = lock_runner(shared_runner_mutex);
 
+    void *runner =
+        locked_runner(shared_runner, JxlResizableParallelRunnerSuggestThreads(1024, 1024));
 
-    // NOLINTNEXTLINE(misc-const-correctness)
-    void *runner = shared_runner;
-    if (runner == nullptr) {
-      runner = get_global_runner(JxlResizableParallelRunnerSuggestThreads(1024, 1024));
-    }
-
-    JxlEncoderPtr enc(JxlEncoderCreate(nullptr));
-    if (enc == nullptr)
-      throw std::runtime_error("JxlEncoderCreate failed");
+    compressed.emplace(
+        transcode_jpeg(reuse_encoder(encoder), runner, buffer.data(), buffer.size(), effort));
+  }
+  return compressed->release();
+}
 
-    if (runner != nullptr) {
-      if (JXL_ENC_SUCCESS !=
-          JxlEncoderSetParallelRunner(enc.get(), JxlResizableParallelRunner, runner)) {
-        throw std::runtime_error("JxlEncoderSetParallelRunner failed");
-      }
-    }
+// Transcodes every JPEG under a single GIL release and a single runner lock.
+// NOLINTNEXTLINE(bugprone-easily-swappable-parameters)
+nb::list jpeg_to_jxl_many_impl(nb::sequence blobs,
+                               int effort,
+                               JxlRunnerPtr *shared_runner,
+                               void *shared_runner_mutex,
+                               JxlEncoderPtr *encoder = nullptr) {
+  std::vector<std::unique_ptr<BufferView>> buffers;
+  for (nb::handle blob : blobs) {
+    buffers.push_back(std::make_unique<BufferView>(blob));
+  }
 
-    if (JXL_ENC_SUCCESS != JxlEncoderUseContainer(enc.get(), JXL_TRUE)) {
-      throw std::runtime_error("JxlEncoderUseContainer failed");
-    }
+  effort = std::clamp(effort, 1, 11);
 
-    if (JXL_ENC_SUCCESS != JxlEncoderStoreJPEGMetadata(enc.get(), JXL_TRUE)) {
-      throw std::runtime_error("JxlEncoderStoreJPEGMetadata failed");
-    }
+  std::vector<BytesBuffer> compressed;
+  compressed.reserve(buffers.size());
+  {
+    nb::gil_scoped_release release;
+    const auto lock = lock_runner(shared_runner_mutex);
 
-    JxlEncoderFrameSettings *settings = JxlEncoderFrameSettingsCreate(enc.get(), nullptr);
-    if (JXL_ENC_SUCCESS !=
-        JxlEncoderFrameSettingsSetOption(settings, JXL_ENC_FRAME_SETTING_EFFORT, effort)) {
-      throw std::runtime_error("JxlEncoderFrameSettingsSetOption(EFFORT) failed");
-    }
+    void *runner =
+        locked_runner(shared_runner, JxlResizableParallelRunnerSuggestThreads(1024, 1024));
 
-    if (JXL_ENC_SUCCESS != JxlEncoderAddJPEGFrame(settings, jpeg_ptr, jpeg_len)) {
-      throw std::runtime_error("JxlEncoderAddJPEGFrame failed (input may not be a valid JPEG)");
+    for (size_t i = 0; i < buffers.size(); ++i) {
+      compressed.push_back(transcode_jpeg(
+          reuse_encoder(encoder), runner, buffers[i]->data(), buffers[i]->size(), effort));
     }
+  }
 
-    JxlEncoderCloseInput(enc.get());
+  nb::list result;
+  for (auto &data : compressed) {
+    result.append(data.release());
+  }
+  return result;
+}
 
-    compressed.resize(jpeg_len + 4096);
-    uint8_t *next_out = compressed.data();
-    size_t avail_out = compressed.size();
-    JxlEncoderStatus status = JXL_ENC_NEED_MORE_OUTPUT;
+nb::bytes jpeg_to_jxl_free(nb::handle jpeg_data, int effort = 7) {
+  return jpeg_to_jxl(jpeg_data, effort, nullptr, nullptr);
+}
 
-    while (status == JXL_ENC_NEED_MORE_OUTPUT) {
-      status = JxlEncoderProcessOutput(enc.get(), &next_out, &avail_out);
-      if (status == JXL_ENC_NEED_MORE_OUTPUT) {
-        size_t offset = next_out - compressed.data();
-        compressed.resize(compressed.size() * 2);
-        next_out = compressed.data() + offset;
-        avail_out = compressed.size() - offset;
-      }
-    }
-    if (status != JXL_ENC_SUCCESS) {
-      throw std::runtime_error("JxlEncoderProcessOutput failed");
-    }
-    compressed.resize(next_out - compressed.data());
-  }
-  return nb::bytes(reinterpret_cast<const char *>(compressed.data()), compressed.size());
+nb::list jpeg_to_jxl_many(nb::sequence blobs, int effort = 7) {
+  return jpeg_to_jxl_many_impl(blobs, effort, nullptr, nullptr);
 }
 
 // NOLINTNEXTLINE(cppcoreguidelines-avoid-non-const-global-variables)
 // NOLINTNEXTLINE(readability-function-cognitive-complexity,bugprone-easily-swappable-parameters,cppcoreguidelines-avoid-non-const-global-variables)
 
 // NOLINTNEXTLINE(readability-function-cognitive-complexity,bugprone-easily-swappable-parameters)
-nb::bytes jxl_to_jpeg(nb::bytes jxl_data, void *shared_runner, void *shared_runner_mutex) {
-  char *raw_ptr = nullptr; // NOLINT
-  Py_ssize_t raw_size = 0;
-  if (PyBytes_AsStringAndSize(jxl_data.ptr(), &raw_ptr, &raw_size) != 0) {
-    throw nb::python_error();
-  }
-  const auto *jxl_ptr = reinterpret_cast<const uint8_t *>(raw_ptr);
-  const auto jxl_len = static_cast<size_t>(raw_size);
+nb::bytes jxl_to_jpeg(nb::handle jxl_data,
+                      JxlRunnerPtr *shared_runner,
+                      void *shared_runner_mutex,
+                      JxlDecoderPtr *decoder = nullptr) {
+  const BufferView buffer(jxl_data);
+  const uint8_t *jxl_ptr = buffer.data();
+  const size_t jxl_len = buffer.size();
 
   std::vector<uint8_t> jpeg_data;
   {
     nb::gil_scoped_release release;
-    std::unique_lock<std::mutex> lock;
-
-    // NOLINTNEXTLINE(bugprone-branch-clone)
-    if (shared_runner_mutex != nullptr) {
-      lock = std::unique_lock<std::mutex>(*static_cast<std::mutex *>(shared_runner_mutex));
-    } else {
-      lock = std::unique_lock<std::mutex>(global_runner_mutex);
-    }
-
+    const auto lock = lock_runner(shared_runner_mutex);
 
-    // NOLINTNEXTLINE(misc-const-correctness)
-    void *runner = shared_runner;
-    if (runner == nullptr) {
-      runner = get_global_runner(JxlResizableParallelRunnerSuggestThreads(1024, 1024));
-    }
+    void *runner =
+        locked_runner(shared_runner, JxlResizableParallelRunnerSuggestThreads(1024, 1024));
 
-    JxlDecoderPtr dec(JxlDecoderCreate(nullptr));
-    if (dec == nullptr) {
-      throw std::runtime_error("JxlDecoderCreate failed");
-    }
+    JxlDecoder *dec = reuse_decoder(decoder);
 
     if (runner != nullptr) {
-      if (JXL_DEC_SUCCESS !=
-          JxlDecoderSetParallelRunner(dec.get(), JxlResizableParallelRunner, runner)) {
+      if (JXL_DEC_SUCCESS != JxlDecoderSetParallelRunner(dec, JxlResizableParallelRunner, runner)) {
         throw std::runtime_error("JxlDecoderSetParallelRunner failed");
       }
     }
 
     if (JXL_DEC_SUCCESS !=
-        JxlDecoderSubscribeEvents(dec.get(), JXL_DEC_JPEG_RECONSTRUCTION | JXL_DEC_FULL_IMAGE)) {
+        JxlDecoderSubscribeEvents(dec, JXL_DEC_JPEG_RECONSTRUCTION | JXL_DEC_FULL_IMAGE)) {
       throw std::runtime_error("JxlDecoderSubscribeEvents failed");
     }
 
-    JxlDecoderSetInput(dec.get(), jxl_ptr, jxl_len);
-    JxlDecoderCloseInput(dec.get());
+    JxlDecoderSetInput(dec, jxl_ptr, jxl_len);
+    JxlDecoderCloseInput(dec);
 
     constexpr size_t k_initial_size = 4096;
     jpeg_data.resize(k_initial_size);
@@ -720,33 +1017,31 @@ nb::bytes jxl_to_jpeg(nb::bytes jxl_data, void *shared_runner, void *shared_runn
     bool reconstruction_seen = false;
 
     for (int i = 0; i < 1000; ++i) { // Safety limit to prevent infinite loop
-      JxlDecoderStatus status = JxlDecoderProcessInput(dec.get());
+      JxlDecoderStatus status = JxlDecoderProcessInput(dec);
 
       if (status == JXL_DEC_ERROR) {
         throw std::runtime_error("JxlDecoderProcessInput failed with JXL_DEC_ERROR");
       }
       if (status == JXL_DEC_SUCCESS) {
         if (reconstruction_seen) {
-          size_t remaining = JxlDecoderReleaseJPEGBuffer(dec.get());
+          size_t remaining = JxlDecoderReleaseJPEGBuffer(dec);
           jpeg_pos = jpeg_data.size() - remaining;
         }
         break;
       }
       if (status == JXL_DEC_JPEG_RECONSTRUCTION) {
         reconstruction_seen = true;
-        if (JXL_DEC_SUCCESS !=
-            JxlDecoderSetJPEGBuffer(dec.get(), jpeg_data.data(), jpeg_data.size())) {
+        if (JXL_DEC_SUCCESS != JxlDecoderSetJPEGBuffer(dec, jpeg_data.data(), jpeg_data.size())) {
           throw std::runtime_error("JxlDecoderSetJPEGBuffer failed");
         }
         continue;
       }
       if (status == JXL_DEC_JPEG_NEED_MORE_OUTPUT) {
-        size_t remaining = JxlDecoderReleaseJPEGBuffer(dec.get());
+        size_t remaining = JxlDecoderReleaseJPEGBuffer(dec);
         jpeg_pos = jpeg_data.size() - remaining;
         jpeg_data.resize(jpeg_data.size() * 2);
-        if (JXL_DEC_SUCCESS != JxlDecoderSetJPEGBuffer(dec.get(),
-                                                       jpeg_data.data() + jpeg_pos,
-                                                       jpeg_data.size() - jpeg_pos)) {
+        if (JXL_DEC_SUCCESS != JxlDecoderSetJPEGBuffer(
+                                   dec, jpeg_data.data() + jpeg_pos, jpeg_data.size() - jpeg_pos)) {
           throw std::runtime_error("JxlDecoderSetJPEGBuffer failed after resize");
         }
         continue;
@@ -770,6 +1065,10 @@ nb::bytes jxl_to_jpeg(nb::bytes jxl_data, void *shared_runner, void *shared_runn
   return nb::bytes(reinterpret_cast<const char *>(jpeg_data.data()), jpeg_data.size());
 }
 
+nb::bytes jxl_to_jpeg_free(nb::handle jxl_data) {
+  return jxl_to_jpeg(jxl_data, nullptr, nullptr);
+}
+
 class PyJxlCodec {
 public:
   // NOLINTNEXTLINE(bugprone-easily-swappable-parameters,cppcoreguidelines-pro-type-member-init)
@@ -796,7 +1095,8 @@ public:
     JxlResizableParallelRunnerSetThreads(runner_.get(), num_threads);
   }
 
-  ~PyJxlCodec() { close(); }
+  // Nothing else can hold the codec while it is being destroyed, so no lock is needed.
+  ~PyJxlCodec() { release_resources(); }
 
   PyJxlCodec(const PyJxlCodec &) = delete;
   PyJxlCodec &operator=(const PyJxlCodec &) = delete;
@@ -804,7 +1104,7 @@ public:
   PyJxlCodec &operator=(PyJxlCodec &&) = delete;
 
   // NOLINTNEXTLINE(bugprone-easily-swappable-parameters)
-  nb::bytes encode_image(nb::ndarray<uint8_t, nb::c_contig, nb::device::cpu> input,
+  nb::bytes encode_image(InputArray input,
                          std::optional<int> effort,
                          std::optional<float> distance,
                          std::optional<bool> lossless,
@@ -817,35 +1117,76 @@ public:
     bool ll = lossless.value_or(lossless_);
     float dist = distance.value_or(ll ? 0.0F : distance_);
     int ds = decoding_speed.value_or(decoding_speed_);
-    return encode_impl(input, eff, dist, ll, ds, exif, xmp, jumbf, runner_.get(), &mutex_);
+    return encode_impl(input, eff, dist, ll, ds, exif, xmp, jumbf, &runner_, &mutex_, &encoder_);
+  }
+
+  // Session-defaults fast path used by the Python wrappers when no per-call
+  // override is given: four fewer arguments to convert and no optional merging.
+  nb::bytes
+  encode_image_default(InputArray input, nb::handle exif, nb::handle xmp, nb::handle jumbf) {
+    check_closed();
+    return encode_impl(input,
+                       effort_,
+                       distance_,
+                       lossless_,
+                       decoding_speed_,
+                       exif,
+                       xmp,
+                       jumbf,
+                       &runner_,
+                       &mutex_,
+                       &encoder_);
+  }
+
+  // NOLINTNEXTLINE(bugprone-easily-swappable-parameters)
+  nb::list encode_images(const std::vector<InputArray> &inputs,
+                         std::optional<int> effort,
+                         std::optional<float> distance,
+                         std::optional<bool> lossless,
+                         std::optional<int> decoding_speed) {
+    check_closed();
+    int eff = effort.value_or(effort_);
+    bool ll = lossless.value_or(lossless_);
+    float dist = distance.value_or(ll ? 0.0F : distance_);
+    int ds = decoding_speed.value_or(decoding_speed_);
+    return encode_many_impl(inputs, eff, dist, ll, ds, &runner_, &mutex_, &encoder_);
   }
 
-  nb::object decode_image(nb::bytes data, bool metadata) {
+  nb::object decode_image(nb::handle data, bool metadata, nb::handle out) {
     check_closed();
-    return decode_impl(data, metadata, runner_.get(), &mutex_);
+    return decode_impl(data, metadata, out, &runner_, &mutex_, &decoder_);
+  }
+
+  nb::list decode_images(nb::sequence blobs, bool metadata) {
+    check_closed();
+    return decode_many_impl(blobs, metadata, &runner_, &mutex_, &decoder_);
   }
 
   // NOLINTNEXTLINE(bugprone-easily-swappable-parameters)
-  nb::bytes encode_jpeg_image(nb::ndarray<uint8_t, nb::c_contig, nb::device::cpu> input,
-                              int quality) {
+  nb::bytes encode_jpeg_image(InputArray input, int quality) {
     check_closed();
     return encode_jpeg(input, quality);
   }
 
-  nb::ndarray<uint8_t, nb::numpy, nb::device::cpu> decode_jpeg_image(nb::bytes data) {
+  nb::ndarray<uint8_t, nb::numpy, nb::device::cpu> decode_jpeg_image(nb::handle data) {
     check_closed();
     return decode_jpeg(data);
   }
 
   // NOLINTNEXTLINE(bugprone-easily-swappable-parameters)
-  nb::bytes jpeg_to_jxl_image(nb::bytes jpeg_data, std::optional<int> effort) {
+  nb::bytes jpeg_to_jxl_image(nb::handle jpeg_data, std::optional<int> effort) {
     check_closed();
-    return jpeg_to_jxl(jpeg_data, effort.value_or(effort_), runner_.get(), &mutex_);
+    return jpeg_to_jxl(jpeg_data, effort.value_or(effort_), &runner_, &mutex_, &encoder_);
   }
 
-  nb::bytes jxl_to_jpeg_image(nb::bytes jxl_data) {
+  nb::list jpeg_to_jxl_images(nb::sequence blobs, std::optional<int> effort) {
     check_closed();
-    return jxl_to_jpeg(jxl_data, runner_.get(), &mutex_);
+    return jpeg_to_jxl_many_impl(blobs, effort.value_or(effort_), &runner_, &mutex_, &encoder_);
+  }
+
+  nb::bytes jxl_to_jpeg_image(nb::handle jxl_data) {
+    check_closed();
+    return jxl_to_jpeg(jxl_data, &runner_, &mutex_, &decoder_);
   }
 
   PyJxlCodec &enter() {
@@ -857,12 +1198,23 @@ public:
 
   void close() {
     closed_ = true;
-    runner_.reset();
+    // A call may still be running on this codec, e.g. an executor job left behind by a
+    // cancelled task. Wait for it to let go of the runner before freeing anything; calls
+    // queued behind it then find the runner gone and raise.
+    nb::gil_scoped_release release;
+    const std::lock_guard<std::mutex> lock(mutex_);
+    release_resources();
   }
 
   [[nodiscard]] bool closed() const { return closed_; }
 
 private:
+  void release_resources() {
+    encoder_.reset();
+    decoder_.reset();
+    runner_.reset();
+  }
+
   void check_closed() const {
     if (closed_) {
       throw std::runtime_error("Cannot use a closed JXL codec");
@@ -875,9 +1227,20 @@ private:
   int decoding_speed_;
   bool closed_ = false;
   JxlRunnerPtr runner_;
+  JxlEncoderPtr encoder_;
+  JxlDecoderPtr decoder_;
   std::mutex mutex_;
 };
 
+// Names of the SIMD targets libjxl can dispatch to on this CPU, best first.
+nb::list simd_targets() {
+  nb::list names;
+  for (const int64_t target : hwy::SupportedAndGeneratedTargets()) {
+    names.append(hwy::TargetName(target));
+  }
+  return names;
+}
+
 } // namespace
 
 NB_MODULE(_pylibjxl, m) { // NOLINT
@@ -896,6 +1259,10 @@ NB_MODULE(_pylibjxl, m) { // NOLINT
 
   m.def("decoder_version", &JxlDecoderVersion, "Get libjxl decoder version");
   m.def("encoder_version", &JxlEncoderVersion, "Get libjxl encoder version");
+  m.def("simd_targets",
+        &simd_targets,
+        "SIMD instruction sets libjxl can use on this CPU, best first (e.g. ['AVX3', 'AVX2', "
+        "'SSE4', 'SSE2']).");
 
   m.def("encode",
         &encode,
@@ -924,8 +1291,32 @@ NB_MODULE(_pylibjxl, m) { // NOLINT
         "When metadata=True, returns a tuple of (array, dict) where dict\n"
         "contains the extracted metadata (exif, xmp, jumbf as bytes).\n\n"
         "Args:\n"
-        "    data: bytes object containing JXL-encoded data\n"
-        "    metadata: If True, also extract metadata boxes (default False)\n",
+        "    data: bytes-like object (bytes, bytearray, memoryview, mmap)\n"
+        "          containing JXL-encoded data\n"
+        "    metadata: If True, also extract metadata boxes (default False)\n"
+        "    out: Optional writable C-contiguous uint8 array to decode into; its\n"
+        "         shape must match the image. It is returned in place of a new array.\n",
+        "data"_a,
+        "metadata"_a = false,
+        "out"_a = nb::none());
+
+  m.def("encode_many",
+        &encode_many,
+        "Encode a list of numpy arrays (H, W, C) to a list of JXL bytes.\n\n"
+        "All images are encoded under a single GIL release, so this is cheaper\n"
+        "than gathering many encode_async() calls when the images are small.\n"
+        "Options apply to every image; see encode() for their meaning.\n",
+        "images"_a,
+        "effort"_a = 7,
+        "distance"_a = 1.0F,
+        "lossless"_a = false,
+        "decoding_speed"_a = 0);
+
+  m.def("decode_many",
+        &decode_many,
+        "Decode a sequence of JXL bytes-like objects to a list of numpy arrays.\n\n"
+        "All images are decoded under a single GIL release. With metadata=True\n"
+        "each item is an (array, dict) tuple as returned by decode().\n",
         "data"_a,
         "metadata"_a = false);
 
@@ -961,9 +1352,31 @@ NB_MODULE(_pylibjxl, m) { // NOLINT
            "exif"_a = nb::none(),
            "xmp"_a = nb::none(),
            "jumbf"_a = nb::none())
+      .def("_encode_default",
+           &PyJxlCodec::encode_image_default,
+           "Encode with the constructor defaults (no per-call overrides).",
+           "input"_a,
+           "exif"_a = nb::none(),
+           "xmp"_a = nb::none(),
+           "jumbf"_a = nb::none())
       .def("decode",
            &PyJxlCodec::decode_image,
-           "Decode JXL bytes, optionally extracting metadata.",
+           "Decode JXL bytes, optionally extracting metadata.\n\n"
+           "Pass out= to decode into an existing array of the right shape.",
+           "data"_a,
+           "metadata"_a = false,
+           "out"_a = nb::none())
+      .def("encode_many",
+           &PyJxlCodec::encode_images,
+           "Encode a list of numpy arrays to a list of JXL bytes under one GIL release.",
+           "images"_a,
+           "effort"_a = nb::none(),
+           "distance"_a = nb::none(),
+           "lossless"_a = nb::none(),
+           "decoding_speed"_a = nb::none())
+      .def("decode_many",
+           &PyJxlCodec::decode_images,
+           "Decode a sequence of JXL bytes to a list of arrays under one GIL release.",
            "data"_a,
            "metadata"_a = false)
       .def("encode_jpeg",
@@ -980,11 +1393,19 @@ NB_MODULE(_pylibjxl, m) { // NOLINT
            "Losslessly recompress JPEG bytes to JXL bytes.",
            "data"_a,
            "effort"_a = nb::none())
+      .def("jpeg_to_jxl_many",
+           &PyJxlCodec::jpeg_to_jxl_images,
+           "Losslessly recompress a sequence of JPEG bytes under one GIL release.",
+           "data"_a,
+           "effort"_a = nb::none())
       .def("jxl_to_jpeg",
            &PyJxlCodec::jxl_to_jpeg_image,
            "Reconstruct original JPEG bytes from JXL bytes.",
            "data"_a)
-      .def("close", &PyJxlCodec::close, "Close the codec and release thread pool resources.")
+      .def("close",
+           &PyJxlCodec::close,
+           "Close the codec and release thread pool resources.\n\n"
+           "Waits for a call still running on the codec to finish first.")
       .def_prop_ro("closed", &PyJxlCodec::closed, "Whether the codec has been closed.")
       .def("__enter__", &PyJxlCodec::enter, nb::rv_policy::reference)
       .def("__exit__",
@@ -1007,17 +1428,20 @@ NB_MODULE(_pylibjxl, m) { // NOLINT
         "data"_a);
 
   m.def("jpeg_to_jxl",
-        &jpeg_to_jxl,
+        &jpeg_to_jxl_free,
         "Losslessly recompress valid JPEG bytes to JXL bytes.",
         "data"_a,
-        "effort"_a = 7,
-        "shared_runner"_a = nullptr,
-        "shared_runner_mutex"_a = nullptr);
+        "effort"_a = 7);
+
+  m.def("jpeg_to_jxl_many",
+        &jpeg_to_jxl_many,
+        "Losslessly recompress a sequence of JPEG bytes to a list of JXL bytes\n"
+        "under a single GIL release.",
+        "data"_a,
+        "effort"_a = 7);
 
   m.def("jxl_to_jpeg",
-        &jxl_to_jpeg,
+        &jxl_to_jpeg_free,
         "Reconstruct original JPEG bytes from JXL bytes (if recompressed).",
-        "data"_a,
-        "shared_runner"_a = nullptr,
-        "shared_runner_mutex"_a = nullptr);
+        "data"_a);
 }
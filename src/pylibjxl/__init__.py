@@ -1,4 +1,9 @@
 import asyncio
+import mmap
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 
 from ._pylibjxl import (  # type: ignore
@@ -7,12 +12,16 @@ from ._pylibjxl import (  # type: ignore
 from ._pylibjxl import (  # type: ignore
     decode,
     decode_jpeg,
+    decode_many,
     decoder_version,
     encode,
     encode_jpeg,
+    encode_many,
     encoder_version,
     jpeg_to_jxl,
+    jpeg_to_jxl_many,
     jxl_to_jpeg,
+    simd_targets,
     version,
 )
 
@@ -20,10 +29,15 @@ __all__ = [
     "version",
     "decoder_version",
     "encoder_version",
+    "simd_targets",
     "encode",
     "decode",
     "encode_async",
     "decode_async",
+    "encode_many",
+    "decode_many",
+    "encode_many_async",
+    "decode_many_async",
     "read",
     "write",
     "read_async",
@@ -40,8 +54,12 @@ __all__ = [
     "jxl_to_jpeg",
     "encode_jpeg_async",
     "decode_jpeg_async",
+    "decode_jpeg_batch",
     "jpeg_to_jxl_async",
     "jxl_to_jpeg_async",
+    "jpeg_to_jxl_many",
+    "jpeg_to_jxl_many_async",
+    "jpeg_to_jxl_batch",
     "convert_jpeg_to_jxl",
     "convert_jxl_to_jpeg",
     "convert_jpeg_to_jxl_async",
@@ -49,6 +67,81 @@ __all__ = [
 ]
 
 
+@contextmanager
+def _mapped(path):
+    """Memory-map a file read-only for the duration of the block.
+
+    The mapping exports the buffer protocol, so it is passed to the decoders
+    directly instead of first copying the whole file into a ``bytes`` object.
+    ``path`` may be a str, bytes or os.PathLike; a missing file raises
+    FileNotFoundError straight from open(), without a separate stat() call.
+    A binary file object (anything with ``read()``, e.g. io.BytesIO) is read
+    from its current position instead.
+    """
+    if hasattr(path, "read"):
+        yield path.read()
+        return
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        raise FileNotFoundError(f"No such file: '{os.fsdecode(path)}'") from None
+    with f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # Empty files cannot be mapped; let the decoder report them.
+            yield b""
+            return
+        mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if hasattr(mmap, "MADV_SEQUENTIAL"):  # not available on Windows
+        # The decoders read front to back; let the kernel read ahead and
+        # drop pages behind the cursor.
+        mapping.madvise(mmap.MADV_SEQUENTIAL)
+    with mapping:
+        yield mapping
+
+
+def _write_file(path, data):
+    """Write ``data`` to ``path``, creating missing parent directories.
+
+    The file is opened directly and the parents are only created when that
+    fails, so writes into an existing directory cost no extra mkdir()/stat()
+    calls. It is opened unbuffered: the encoded bytes go straight to write(2)
+    with no intermediate BufferedWriter, looping over short writes. A binary
+    file object (anything with ``write()``) is written to directly.
+    """
+    if hasattr(path, "write"):
+        path.write(data)
+        return
+    try:
+        f = open(path, "wb", buffering=0)
+    except FileNotFoundError:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        f = open(path, "wb", buffering=0)
+    with f, memoryview(data) as view:
+        while view:
+            written = f.write(view)
+            view = view[written:]
+
+
+def _encode_with(codec, image, effort, distance, lossless, decoding_speed, exif, xmp, jumbf):
+    """Encode with ``codec``, taking the session-defaults fast path if possible."""
+    if effort is None and distance is None and lossless is None and decoding_speed is None:
+        return codec._encode_default(image, exif, xmp, jumbf)
+    return codec.encode(
+        image, effort, distance, lossless, decoding_speed, exif, xmp, jumbf
+    )
+
+
+def _run(func, *args):
+    """Run a blocking call on the loop's default executor.
+
+    Used instead of asyncio.to_thread(), which wraps every call in a
+    functools.partial and copies the current contextvars.Context; the codec
+    calls never read context variables, so that is pure per-call overhead.
+    Only positional arguments are forwarded.
+    """
+    return asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+
 async def encode_async(
     input,
     effort=7,
@@ -64,7 +157,7 @@ async def encode_async(
     Asynchronously encode a numpy array (H, W, C) to JXL bytes.
     Releases the GIL during the encoding process.
     """
-    return await asyncio.to_thread(
+    return await _run(
         encode,
         input,
         effort,
@@ -77,22 +170,44 @@ async def encode_async(
     )
 
 
-async def decode_async(data, *, metadata=False):
+async def decode_async(data, *, metadata=False, out=None):
     """
     Asynchronously decode JXL bytes to a numpy array (H, W, C).
     Releases the GIL during the decoding process.
 
     When metadata=True, returns (array, dict) with extracted metadata.
+    When out is given, decodes into that array and returns it.
     """
-    return await asyncio.to_thread(decode, data, metadata)
+    return await _run(decode, data, metadata, out)
 
 
-def read(path, *, metadata=False):
+async def encode_many_async(
+    images, effort=7, distance=1.0, lossless=False, decoding_speed=0
+):
+    """
+    Asynchronously encode a list of numpy arrays to a list of JXL bytes.
+    The whole batch runs in one executor call under a single GIL release,
+    which is cheaper than gathering encode_async() over many small images.
+    """
+    return await _run(encode_many, images, effort, distance, lossless, decoding_speed)
+
+
+async def decode_many_async(data, *, metadata=False):
+    """
+    Asynchronously decode a sequence of JXL bytes to a list of numpy arrays.
+    The whole batch runs in one executor call under a single GIL release.
+    """
+    return await _run(decode_many, data, metadata)
+
+
+def read(path, *, metadata=False, out=None):
     """Read a JXL image file and return a numpy array (H, W, C).
 
     Args:
-        path: Path to a .jxl file (str or Path).
+        path: Path to a .jxl file (str or Path), or a binary file object.
         metadata: If True, also return metadata dict (default False).
+        out: Optional preallocated uint8 array of the image's shape to decode
+            into, e.g. to reuse one buffer across same-sized files.
 
     Returns:
         numpy.ndarray when metadata=False,
@@ -101,11 +216,12 @@ def read(path, *, metadata=False):
     Raises:
         FileNotFoundError: If the file does not exist.
     """
-    filepath = Path(path)
-    if not filepath.exists():
-        raise FileNotFoundError(f"No such file: '{filepath}'")
-    data = filepath.read_bytes()
-    return decode(data, metadata)
+    return _read(path, metadata, out)
+
+
+def _read(path, metadata, out=None):
+    with _mapped(path) as data:
+        return decode(data, metadata, out)
 
 
 def write(
@@ -123,7 +239,7 @@ def write(
     """Encode a numpy array and write it to a JXL file.
 
     Args:
-        path: Output file path (str or Path).
+        path: Output file path (str or Path), or a binary file object.
         image: uint8 numpy array of shape (height, width, channels).
         effort: Encoding effort [1-11] (default 7).
         distance: Perceptual distance [0.0-25.0] (default 1.0).
@@ -133,17 +249,19 @@ def write(
         xmp: Optional XMP metadata as bytes.
         jumbf: Optional JUMBF metadata as bytes.
     """
-    filepath = Path(path)
-    filepath.parent.mkdir(parents=True, exist_ok=True)
+    _write(path, image, effort, distance, lossless, decoding_speed, exif, xmp, jumbf)
+
+
+def _write(path, image, effort, distance, lossless, decoding_speed, exif, xmp, jumbf):
     data = encode(
         image, effort, distance, lossless, decoding_speed, exif, xmp, jumbf
     )
-    filepath.write_bytes(data)
+    _write_file(path, data)
 
 
-async def read_async(path, *, metadata=False):
+async def read_async(path, *, metadata=False, out=None):
     """Asynchronously read a JXL image file and return a numpy array."""
-    return await asyncio.to_thread(read, path, metadata=metadata)
+    return await _run(_read, path, metadata, out)
 
 
 async def write_async(
@@ -159,17 +277,17 @@ async def write_async(
     jumbf=None,
 ):
     """Asynchronously encode a numpy array and write it to a JXL file."""
-    return await asyncio.to_thread(
-        write,
+    return await _run(
+        _write,
         path,
         image,
         effort,
         distance,
         lossless,
         decoding_speed,
-        exif=exif,
-        xmp=xmp,
-        jumbf=jumbf,
+        exif,
+        xmp,
+        jumbf,
     )
 
 
@@ -205,13 +323,13 @@ class JXL(_JXL):
 
     # ── JXL File I/O ──
 
-    def read(self, path, *, metadata=False):
-        """Read a JXL file and return a numpy array."""
-        filepath = Path(path)
-        if not filepath.exists():
-            raise FileNotFoundError(f"No such file: '{filepath}'")
-        data = filepath.read_bytes()
-        return self.decode(data, metadata)
+    def read(self, path, *, metadata=False, out=None):
+        """Read a JXL file and return a numpy array.
+
+        Pass out= to decode into a preallocated array of the image's shape.
+        """
+        with _mapped(path) as data:
+            return self.decode(data, metadata, out)
 
     def write(
         self,
@@ -227,53 +345,36 @@ class JXL(_JXL):
         jumbf=None,
     ):
         """Encode a numpy array and write it to a JXL file."""
-        filepath = Path(path)
-        filepath.parent.mkdir(parents=True, exist_ok=True)
-        data = self.encode(
-            image, effort, distance, lossless, decoding_speed, exif, xmp, jumbf
+        data = _encode_with(
+            self, image, effort, distance, lossless, decoding_speed, exif, xmp, jumbf
         )
-        filepath.write_bytes(data)
+        _write_file(path, data)
 
     # ── JPEG File I/O ──
 
     def read_jpeg(self, path):
         """Read a JPEG file and return a numpy array (H, W, 3)."""
-        filepath = Path(path)
-        if not filepath.exists():
-            raise FileNotFoundError(f"No such file: '{filepath}'")
-        data = filepath.read_bytes()
-        return self.decode_jpeg(data)
+        with _mapped(path) as data:
+            return self.decode_jpeg(data)
 
     def write_jpeg(self, path, image, quality=95):
         """Encode a numpy array and write it to a JPEG file."""
-        filepath = Path(path)
-        filepath.parent.mkdir(parents=True, exist_ok=True)
         data = self.encode_jpeg(image, quality=quality)
-        filepath.write_bytes(data)
+        _write_file(path, data)
 
     # ── Cross-Format File Conversion ──
 
     def convert_jpeg_to_jxl(self, jpeg_path, jxl_path, effort=None):
         """Convert a JPEG file to JXL file (lossless transcoding)."""
-        jpeg_filepath = Path(jpeg_path)
-        if not jpeg_filepath.exists():
-            raise FileNotFoundError(f"No such file: '{jpeg_filepath}'")
-        jxl_filepath = Path(jxl_path)
-        jxl_filepath.parent.mkdir(parents=True, exist_ok=True)
-        jpeg_data = jpeg_filepath.read_bytes()
-        jxl_data = self.jpeg_to_jxl(jpeg_data, effort=effort)
-        jxl_filepath.write_bytes(jxl_data)
+        with _mapped(jpeg_path) as jpeg_data:
+            jxl_data = self.jpeg_to_jxl(jpeg_data, effort=effort)
+        _write_file(jxl_path, jxl_data)
 
     def convert_jxl_to_jpeg(self, jxl_path, jpeg_path):
         """Convert a JXL file to JPEG file (lossless reconstruction)."""
-        jxl_filepath = Path(jxl_path)
-        if not jxl_filepath.exists():
-            raise FileNotFoundError(f"No such file: '{jxl_filepath}'")
-        jpeg_filepath = Path(jpeg_path)
-        jpeg_filepath.parent.mkdir(parents=True, exist_ok=True)
-        jxl_data = jxl_filepath.read_bytes()
-        jpeg_data = self.jxl_to_jpeg(jxl_data)
-        jpeg_filepath.write_bytes(jpeg_data)
+        with _mapped(jxl_path) as jxl_data:
+            jpeg_data = self.jxl_to_jpeg(jxl_data)
+        _write_file(jpeg_path, jpeg_data)
 
 
 class AsyncJXL(_JXL):
@@ -320,8 +421,9 @@ class AsyncJXL(_JXL):
         jumbf=None,
     ):
         """Asynchronously encode a numpy array to JXL bytes."""
-        return await asyncio.to_thread(
-            self.encode,
+        return await _run(
+            _encode_with,
+            self,
             input,
             effort,
             distance,
@@ -332,17 +434,25 @@ class AsyncJXL(_JXL):
             jumbf,
         )
 
-    async def decode_async(self, data, *, metadata=False):
+    async def decode_async(self, data, *, metadata=False, out=None):
         """Asynchronously decode JXL bytes to a numpy array."""
-        return await asyncio.to_thread(self.decode, data, metadata)
+        return await _run(self.decode, data, metadata, out)
+
+    async def encode_many_async(
+        self, images, effort=None, distance=None, lossless=None, decoding_speed=None
+    ):
+        """Asynchronously encode a list of numpy arrays in one executor call."""
+        return await _run(
+            self.encode_many, images, effort, distance, lossless, decoding_speed
+        )
 
-    async def read_async(self, path, *, metadata=False):
+    async def decode_many_async(self, data, *, metadata=False):
+        """Asynchronously decode a sequence of JXL bytes in one executor call."""
+        return await _run(self.decode_many, data, metadata)
+
+    async def read_async(self, path, *, metadata=False, out=None):
         """Asynchronously read a JXL file and return a numpy array."""
-        filepath = Path(path)
-        if not filepath.exists():
-            raise FileNotFoundError(f"No such file: '{filepath}'")
-        data = await asyncio.to_thread(filepath.read_bytes)
-        return await asyncio.to_thread(self.decode, data, metadata)
+        return await _run(self._read_sync, path, metadata, out)
 
     async def write_async(
         self,
@@ -358,8 +468,9 @@ class AsyncJXL(_JXL):
         jumbf=None,
     ):
         """Asynchronously encode and write to a JXL file."""
-        data = await asyncio.to_thread(
-            self.encode,
+        await _run(
+            self._write_sync,
+            path,
             image,
             effort,
             distance,
@@ -369,101 +480,169 @@ class AsyncJXL(_JXL):
             xmp,
             jumbf,
         )
-        filepath = Path(path)
-        filepath.parent.mkdir(parents=True, exist_ok=True)
-        await asyncio.to_thread(filepath.write_bytes, data)
 
     # ── JPEG async ──
 
     async def encode_jpeg_async(self, input, quality=95):
         """Asynchronously encode numpy array to JPEG bytes."""
-        return await asyncio.to_thread(self.encode_jpeg, input, quality)
+        return await _run(self.encode_jpeg, input, quality)
 
     async def decode_jpeg_async(self, data):
         """Asynchronously decode JPEG bytes to numpy array."""
-        return await asyncio.to_thread(self.decode_jpeg, data)
+        return await _run(self.decode_jpeg, data)
 
     async def read_jpeg_async(self, path):
         """Asynchronously read a JPEG file."""
-        filepath = Path(path)
-        if not filepath.exists():
-            raise FileNotFoundError(f"No such file: '{filepath}'")
-        data = await asyncio.to_thread(filepath.read_bytes)
-        return await asyncio.to_thread(self.decode_jpeg, data)
+        return await _run(self._read_jpeg_sync, path)
 
     async def write_jpeg_async(self, path, image, quality=95):
         """Asynchronously write a JPEG file."""
-        data = await asyncio.to_thread(self.encode_jpeg, image, quality)
-        filepath = Path(path)
-        filepath.parent.mkdir(parents=True, exist_ok=True)
-        await asyncio.to_thread(filepath.write_bytes, data)
+        await _run(self._write_jpeg_sync, path, image, quality)
 
     # ── Cross-format async ──
 
     async def jpeg_to_jxl_async(self, data, effort=None):
         """Asynchronously transcode JPEG bytes to JXL bytes."""
-        return await asyncio.to_thread(self.jpeg_to_jxl, data, effort)
+        return await _run(self.jpeg_to_jxl, data, effort)
 
     async def jxl_to_jpeg_async(self, data):
         """Asynchronously reconstruct JPEG bytes from JXL bytes."""
-        return await asyncio.to_thread(self.jxl_to_jpeg, data)
+        return await _run(self.jxl_to_jpeg, data)
+
+    async def jpeg_to_jxl_many_async(self, data, effort=None):
+        """Asynchronously transcode a sequence of JPEG bytes in one executor call."""
+        return await _run(self.jpeg_to_jxl_many, data, effort)
 
     async def convert_jpeg_to_jxl_async(self, jpeg_path, jxl_path, effort=None):
         """Asynchronously convert a JPEG file to JXL file."""
-
-        def _convert():
-            jpeg_filepath = Path(jpeg_path)
-            if not jpeg_filepath.exists():
-                raise FileNotFoundError(f"No such file: '{jpeg_filepath}'")
-            jxl_filepath = Path(jxl_path)
-            jxl_filepath.parent.mkdir(parents=True, exist_ok=True)
-            jpeg_data = jpeg_filepath.read_bytes()
-            jxl_data = self.jpeg_to_jxl(jpeg_data, effort=effort)
-            jxl_filepath.write_bytes(jxl_data)
-
-        await asyncio.to_thread(_convert)
+        await _run(self._convert_jpeg_to_jxl_sync, jpeg_path, jxl_path, effort)
 
     async def convert_jxl_to_jpeg_async(self, jxl_path, jpeg_path):
         """Asynchronously convert a JXL file to JPEG file."""
+        await _run(self._convert_jxl_to_jpeg_sync, jxl_path, jpeg_path)
 
-        def _convert():
-            jxl_filepath = Path(jxl_path)
-            if not jxl_filepath.exists():
-                raise FileNotFoundError(f"No such file: '{jxl_filepath}'")
-            jpeg_filepath = Path(jpeg_path)
-            jpeg_filepath.parent.mkdir(parents=True, exist_ok=True)
-            jxl_data = jxl_filepath.read_bytes()
-            jpeg_data = self.jxl_to_jpeg(jxl_data)
-            jpeg_filepath.write_bytes(jpeg_data)
+    # ── Blocking bodies, run on the executor by the methods above ──
 
-        await asyncio.to_thread(_convert)
+    def _read_sync(self, path, metadata, out):
+        # Map on the worker thread so page faults never block the loop.
+        with _mapped(path) as data:
+            return self.decode(data, metadata, out)
+
+    def _write_sync(
+        self, path, image, effort, distance, lossless, decoding_speed, exif, xmp, jumbf
+    ):
+        data = _encode_with(
+            self, image, effort, distance, lossless, decoding_speed, exif, xmp, jumbf
+        )
+        _write_file(path, data)
+
+    def _read_jpeg_sync(self, path):
+        with _mapped(path) as data:
+            return self.decode_jpeg(data)
+
+    def _write_jpeg_sync(self, path, image, quality):
+        data = self.encode_jpeg(image, quality)
+        _write_file(path, data)
+
+    def _convert_jpeg_to_jxl_sync(self, jpeg_path, jxl_path, effort):
+        with _mapped(jpeg_path) as jpeg_data:
+            jxl_data = self.jpeg_to_jxl(jpeg_data, effort=effort)
+        _write_file(jxl_path, jxl_data)
+
+    def _convert_jxl_to_jpeg_sync(self, jxl_path, jpeg_path):
+        with _mapped(jxl_path) as jxl_data:
+            jpeg_data = self.jxl_to_jpeg(jxl_data)
+        _write_file(jpeg_path, jpeg_data)
 
 
 async def encode_jpeg_async(input, quality=95):
     """Async encode numpy array to JPEG bytes."""
-    return await asyncio.to_thread(encode_jpeg, input, quality=quality)
+    return await _run(encode_jpeg, input, quality)
 
 
 async def decode_jpeg_async(data):
     """Async decode JPEG bytes to numpy array."""
-    return await asyncio.to_thread(decode_jpeg, data)
+    return await _run(decode_jpeg, data)
 
 
 async def jpeg_to_jxl_async(data, effort=7):
     """Async losslessly recompress JPEG bytes to JXL bytes."""
-    return await asyncio.to_thread(jpeg_to_jxl, data, effort=effort)
+    return await _run(jpeg_to_jxl, data, effort)
 
 
 async def jxl_to_jpeg_async(data):
     """Async reconstruct original JPEG bytes from JXL bytes."""
-    return await asyncio.to_thread(jxl_to_jpeg, data)
+    return await _run(jxl_to_jpeg, data)
+
+
+async def jpeg_to_jxl_many_async(data, effort=7):
+    """Async losslessly recompress a sequence of JPEG bytes to JXL bytes."""
+    return await _run(jpeg_to_jxl_many, data, effort)
+
+
+def jpeg_to_jxl_batch(data, effort=7, *, prefetch=2):
+    """Transcode an iterable of JPEG bytes, yielding JXL bytes in order.
+
+    Transcoding runs on a background thread (with the GIL released) while
+    the caller produces the next input and consumes previous results, so
+    reading and writing files overlaps with the native work instead of
+    alternating with it. Up to ``prefetch`` transcodes are queued ahead of
+    the consumer; ``data`` may be a lazy generator.
+
+    Args:
+        data: Iterable of bytes-like JPEG data.
+        effort: Encoding effort [1-10] (default 7).
+        prefetch: Number of transcodes to queue ahead (default 2).
+
+    Raises:
+        ValueError: If ``prefetch`` is below 1, at call time rather than on
+            the first ``next()``.
+    """
+    if prefetch < 1:
+        raise ValueError(f"prefetch must be >= 1, got {prefetch}")
+    return _jpeg_to_jxl_batch(data, effort, prefetch)
+
+
+def _jpeg_to_jxl_batch(data, effort, prefetch):
+    pending = deque()
+    pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pylibjxl-transcode")
+    try:
+        for blob in data:
+            pending.append(pool.submit(jpeg_to_jxl, blob, effort))
+            if len(pending) > prefetch:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def decode_jpeg_batch(data, workers=None):
+    """Decode a sequence of JPEG bytes in parallel, returning arrays in order.
+
+    decode_jpeg() releases the GIL and holds no shared state, so a thread
+    pool decodes several JPEGs at once across cores.
+
+    Args:
+        data: Iterable of bytes-like JPEG data.
+        workers: Number of decoding threads (default: os.cpu_count()).
+
+    Returns:
+        List of numpy.ndarray of shape (H, W, 3), dtype uint8.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"workers must be >= 1, got {workers}")
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pylibjxl-decode") as pool:
+        return list(pool.map(decode_jpeg, data))
 
 
 def read_jpeg(path):
     """Read a JPEG image file and return a numpy array (H, W, 3).
 
     Args:
-        path: Path to a .jpg/.jpeg file (str or Path).
+        path: Path to a .jpg/.jpeg file (str or Path), or a binary file object.
 
     Returns:
         numpy.ndarray of shape (H, W, 3), dtype uint8.
@@ -471,35 +650,30 @@ def read_jpeg(path):
     Raises:
         FileNotFoundError: If the file does not exist.
     """
-    filepath = Path(path)
-    if not filepath.exists():
-        raise FileNotFoundError(f"No such file: '{filepath}'")
-    data = filepath.read_bytes()
-    return decode_jpeg(data)
+    with _mapped(path) as data:
+        return decode_jpeg(data)
 
 
 def write_jpeg(path, image, quality=95):
     """Encode a numpy array and write it to a JPEG file.
 
     Args:
-        path: Output file path (str or Path).
+        path: Output file path (str or Path), or a binary file object.
         image: uint8 numpy array of shape (H, W, 3) or (H, W, 4).
         quality: JPEG quality [1-100] (default 95).
     """
-    filepath = Path(path)
-    filepath.parent.mkdir(parents=True, exist_ok=True)
     data = encode_jpeg(image, quality=quality)
-    filepath.write_bytes(data)
+    _write_file(path, data)
 
 
 async def read_jpeg_async(path):
     """Asynchronously read a JPEG image file and return a numpy array."""
-    return await asyncio.to_thread(read_jpeg, path)
+    return await _run(read_jpeg, path)
 
 
 async def write_jpeg_async(path, image, quality=95):
     """Asynchronously encode a numpy array and write it to a JPEG file."""
-    return await asyncio.to_thread(write_jpeg, path, image, quality)
+    return await _run(write_jpeg, path, image, quality)
 
 
 def convert_jpeg_to_jxl(jpeg_path, jxl_path, effort=7):
@@ -509,18 +683,13 @@ def convert_jpeg_to_jxl(jpeg_path, jxl_path, effort=7):
     can be restored from the JXL file using convert_jxl_to_jpeg().
 
     Args:
-        jpeg_path: Input JPEG file path (str or Path).
-        jxl_path: Output JXL file path (str or Path).
+        jpeg_path: Input JPEG file path (str or Path), or a binary file object.
+        jxl_path: Output JXL file path (str or Path), or a binary file object.
         effort: Encoding effort [1-10] (default 7).
     """
-    jpeg_filepath = Path(jpeg_path)
-    if not jpeg_filepath.exists():
-        raise FileNotFoundError(f"No such file: '{jpeg_filepath}'")
-    jxl_filepath = Path(jxl_path)
-    jxl_filepath.parent.mkdir(parents=True, exist_ok=True)
-    jpeg_data = jpeg_filepath.read_bytes()
-    jxl_data = jpeg_to_jxl(jpeg_data, effort=effort)
-    jxl_filepath.write_bytes(jxl_data)
+    with _mapped(jpeg_path) as jpeg_data:
+        jxl_data = jpeg_to_jxl(jpeg_data, effort=effort)
+    _write_file(jxl_path, jxl_data)
 
 
 def convert_jxl_to_jpeg(jxl_path, jpeg_path):
@@ -530,24 +699,19 @@ def convert_jxl_to_jpeg(jxl_path, jpeg_path):
     the original JPEG is reconstructed losslessly. Otherwise raises an error.
 
     Args:
-        jxl_path: Input JXL file path (str or Path).
-        jpeg_path: Output JPEG file path (str or Path).
+        jxl_path: Input JXL file path (str or Path), or a binary file object.
+        jpeg_path: Output JPEG file path (str or Path), or a binary file object.
     """
-    jxl_filepath = Path(jxl_path)
-    if not jxl_filepath.exists():
-        raise FileNotFoundError(f"No such file: '{jxl_filepath}'")
-    jpeg_filepath = Path(jpeg_path)
-    jpeg_filepath.parent.mkdir(parents=True, exist_ok=True)
-    jxl_data = jxl_filepath.read_bytes()
-    jpeg_data = jxl_to_jpeg(jxl_data)
-    jpeg_filepath.write_bytes(jpeg_data)
+    with _mapped(jxl_path) as jxl_data:
+        jpeg_data = jxl_to_jpeg(jxl_data)
+    _write_file(jpeg_path, jpeg_data)
 
 
 async def convert_jpeg_to_jxl_async(jpeg_path, jxl_path, effort=7):
     """Async convert a JPEG file to JXL file (lossless transcoding)."""
-    return await asyncio.to_thread(convert_jpeg_to_jxl, jpeg_path, jxl_path, effort)
+    return await _run(convert_jpeg_to_jxl, jpeg_path, jxl_path, effort)
 
 
 async def convert_jxl_to_jpeg_async(jxl_path, jpeg_path):
     """Async convert a JXL file to JPEG file."""
-    return await asyncio.to_thread(convert_jxl_to_jpeg, jxl_path, jpeg_path)
+    return await _run(convert_jxl_to_jpeg, jxl_path, jpeg_path)
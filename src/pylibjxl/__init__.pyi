@@ -1,14 +1,32 @@
-from pathlib import Path
-from typing import Any, Dict, Literal, Optional, Tuple, Union, overload
+import os
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    overload,
+)
 
 import numpy as np
 import numpy.typing as npt
+from typing_extensions import Buffer
+
+# File paths, or binary file objects such as io.BytesIO
+PathOrFile = Union[str, "os.PathLike[str]", BinaryIO]
 
 # --- Native extension functions ---
 
 def version() -> Dict[str, int]: ...
 def decoder_version() -> int: ...
 def encoder_version() -> int: ...
+def simd_targets() -> List[str]: ...
 
 def encode(
     input: npt.NDArray[np.uint8],
@@ -22,17 +40,33 @@ def encode(
 ) -> bytes: ...
 
 @overload
-def decode(data: bytes, metadata: Literal[False] = False) -> npt.NDArray[np.uint8]: ...
+def decode(data: Buffer, metadata: Literal[False] = False, out: Optional[npt.NDArray[np.uint8]] = None) -> npt.NDArray[np.uint8]: ...
 @overload
-def decode(data: bytes, metadata: Literal[True]) -> Tuple[npt.NDArray[np.uint8], Dict[str, bytes]]: ...
+def decode(data: Buffer, metadata: Literal[True], out: Optional[npt.NDArray[np.uint8]] = None) -> Tuple[npt.NDArray[np.uint8], Dict[str, bytes]]: ...
 @overload
-def decode(data: bytes, metadata: bool) -> Union[npt.NDArray[np.uint8], Tuple[npt.NDArray[np.uint8], Dict[str, bytes]]]: ...
+def decode(data: Buffer, metadata: bool, out: Optional[npt.NDArray[np.uint8]] = None) -> Union[npt.NDArray[np.uint8], Tuple[npt.NDArray[np.uint8], Dict[str, bytes]]]: ...
+
+def encode_many(
+    images: Sequence[npt.NDArray[np.uint8]],
+    effort: int = 7,
+    distance: float = 1.0,
+    lossless: bool = False,
+    decoding_speed: int = 0,
+) -> List[bytes]: ...
+
+@overload
+def decode_many(data: Sequence[Buffer], metadata: Literal[False] = False) -> List[npt.NDArray[np.uint8]]: ...
+@overload
+def decode_many(data: Sequence[Buffer], metadata: Literal[True]) -> List[Tuple[npt.NDArray[np.uint8], Dict[str, bytes]]]: ...
+@overload
+def decode_many(data: Sequence[Buffer], metadata: bool) -> List[Union[npt.NDArray[np.uint8], Tuple[npt.NDArray[np.uint8], Dict[str, bytes]]]]: ...
 
 def encode_jpeg(input: npt.NDArray[np.uint8], quality: int = 95) -> bytes: ...
-def decode_jpeg(data: bytes) -> npt.NDArray[np.uint8]: ...
+def decode_jpeg(data: Buffer) -> npt.NDArray[np.uint8]: ...
 
-def jpeg_to_jxl(data: bytes, effort: int = 7) -> bytes: ...
-def jxl_to_jpeg(data: bytes) -> bytes: ...
+def jpeg_to_jxl(data: Buffer, effort: int = 7) -> bytes: ...
+def jxl_to_jpeg(data: Buffer) -> bytes: ...
+def jpeg_to_jxl_many(data: Sequence[Buffer], effort: int = 7) -> List[bytes]: ...
 
 class _JXL:
     def __init__(self, effort: int = 7, distance: float = 1.0, lossless: bool = False, decoding_speed: int = 0, threads: int = 0) -> None: ...
@@ -49,16 +83,33 @@ class _JXL:
     ) -> bytes: ...
     
     @overload
-    def decode(self, data: bytes, metadata: Literal[False] = False) -> npt.NDArray[np.uint8]: ...
+    def decode(self, data: Buffer, metadata: Literal[False] = False, out: Optional[npt.NDArray[np.uint8]] = None) -> npt.NDArray[np.uint8]: ...
     @overload
-    def decode(self, data: bytes, metadata: Literal[True]) -> Tuple[npt.NDArray[np.uint8], Dict[str, bytes]]: ...
+    def decode(self, data: Buffer, metadata: Literal[True], out: Optional[npt.NDArray[np.uint8]] = None) -> Tuple[npt.NDArray[np.uint8], Dict[str, bytes]]: ...
     @overload
-    def decode(self, data: bytes, metadata: bool) -> Union[npt.NDArray[np.uint8], Tuple[npt.NDArray[np.uint8], Dict[str, bytes]]]: ...
+    def decode(self, data: Buffer, metadata: bool, out: Optional[npt.NDArray[np.uint8]] = None) -> Union[npt.NDArray[np.uint8], Tuple[npt.NDArray[np.uint8], Dict[str, bytes]]]: ...
+
+    def encode_many(
+        self,
+        images: Sequence[npt.NDArray[np.uint8]],
+        effort: Optional[int] = None,
+        distance: Optional[float] = None,
+        lossless: Optional[bool] = None,
+        decoding_speed: Optional[int] = None,
+    ) -> List[bytes]: ...
+
+    @overload
+    def decode_many(self, data: Sequence[Buffer], metadata: Literal[False] = False) -> List[npt.NDArray[np.uint8]]: ...
+    @overload
+    def decode_many(self, data: Sequence[Buffer], metadata: Literal[True]) -> List[Tuple[npt.NDArray[np.uint8], Dict[str, bytes]]]: ...
+    @overload
+    def decode_many(self, data: Sequence[Buffer], metadata: bool) -> List[Union[npt.NDArray[np.uint8], Tuple[npt.NDArray[np.uint8], Dict[str, bytes]]]]: ...
 
     def encode_jpeg(self, input: npt.NDArray[np.uint8], quality: int = 95) -> bytes: ...
-    def decode_jpeg(self, data: bytes) -> npt.NDArray[np.uint8]: ...
-    def jpeg_to_jxl(self, data: bytes, effort: Optional[int] = None) -> bytes: ...
-    def jxl_to_jpeg(self, data: bytes) -> bytes: ...
+    def decode_jpeg(self, data: Buffer) -> npt.NDArray[np.uint8]: ...
+    def jpeg_to_jxl(self, data: Buffer, effort: Optional[int] = None) -> bytes: ...
+    def jxl_to_jpeg(self, data: Buffer) -> bytes: ...
+    def jpeg_to_jxl_many(self, data: Sequence[Buffer], effort: Optional[int] = None) -> List[bytes]: ...
     def close(self) -> None: ...
     @property
     def closed(self) -> bool: ...
@@ -80,21 +131,36 @@ async def encode_async(
 ) -> bytes: ...
 
 @overload
-async def decode_async(data: bytes, *, metadata: Literal[False] = False) -> npt.NDArray[np.uint8]: ...
+async def decode_async(data: Buffer, *, metadata: Literal[False] = False, out: Optional[npt.NDArray[np.uint8]] = None) -> npt.NDArray[np.uint8]: ...
 @overload
-async def decode_async(data: bytes, *, metadata: Literal[True]) -> Tuple[npt.NDArray[np.uint8], Dict[str, bytes]]: ...
+async def decode_async(data: Buffer, *, metadata: Literal[True], out: Optional[npt.NDArray[np.uint8]] = None) -> Tuple[npt.NDArray[np.uint8], Dict[str, bytes]]: ...
 @overload
-async def decode_async(data: bytes, *, metadata: bool) -> Union[npt.NDArray[np.uint8], Tuple[npt.NDArray[np.uint8], Dict[str, bytes]]]: ...
+async def decode_async(data: Buffer, *, metadata: bool, out: Optional[npt.NDArray[np.uint8]] = None) -> Union[npt.NDArray[np.uint8], Tuple[npt.NDArray[np.uint8], Dict[str, bytes]]]: ...
 
+async def encode_many_async(
+    images: Sequence[npt.NDArray[np.uint8]],
+    effort: int = 7,
+    distance: float = 1.0,
+    lossless: bool = False,
+    decoding_speed: int = 0,
+) -> List[bytes]: ...
+
+@overload
+async def decode_many_async(data: Sequence[Buffer], *, metadata: Literal[False] = False) -> List[npt.NDArray[np.uint8]]: ...
 @overload
-def read(path: Union[str, Path], *, metadata: Literal[False] = False) -> npt.NDArray[np.uint8]: ...
+async def decode_many_async(data: Sequence[Buffer], *, metadata: Literal[True]) -> List[Tuple[npt.NDArray[np.uint8], Dict[str, bytes]]]: ...
 @overload
-def read(path: Union[str, Path], *, metadata: Literal[True]) -> Tuple[npt.NDArray[np.uint8], Dict[str, bytes]]: ...
+async def decode_many_async(data: Sequence[Buffer], *, metadata: bool) -> List[Union[npt.NDArray[np.uint8], Tuple[npt.NDArray[np.uint8], Dict[str, bytes]]]]: ...
+
+@overload
+def read(path: PathOrFile, *, metadata: Literal[False] = False, out: Optional[npt.NDArray[np.uint8]] = None) -> npt.NDArray[np.uint8]: ...
+@overload
+def read(path: PathOrFile, *, metadata: Literal[True], out: Optional[npt.NDArray[np.uint8]] = None) -> Tuple[npt.NDArray[np.uint8], Dict[str, bytes]]: ...
 @overload
-def read(path: Union[str, Path], *, metadata: bool) -> Union[npt.NDArray[np.uint8], Tuple[npt.NDArray[np.uint8], Dict[str, bytes]]]: ...
+def read(path: PathOrFile, *, metadata: bool, out: Optional[npt.NDArray[np.uint8]] = None) -> Union[npt.NDArray[np.uint8], Tuple[npt.NDArray[np.uint8], Dict[str, bytes]]]: ...
 
 def write(
-    path: Union[str, Path],
+    path: PathOrFile,
     image: npt.NDArray[np.uint8],
     effort: int = 7,
     distance: float = 1.0,
@@ -107,14 +173,14 @@ def write(
 ) -> None: ...
 
 @overload
-async def read_async(path: Union[str, Path], *, metadata: Literal[False] = False) -> npt.NDArray[np.uint8]: ...
+async def read_async(path: PathOrFile, *, metadata: Literal[False] = False, out: Optional[npt.NDArray[np.uint8]] = None) -> npt.NDArray[np.uint8]: ...
 @overload
-async def read_async(path: Union[str, Path], *, metadata: Literal[True]) -> Tuple[npt.NDArray[np.uint8], Dict[str, bytes]]: ...
+async def read_async(path: PathOrFile, *, metadata: Literal[True], out: Optional[npt.NDArray[np.uint8]] = None) -> Tuple[npt.NDArray[np.uint8], Dict[str, bytes]]: ...
 @overload
-async def read_async(path: Union[str, Path], *, metadata: bool) -> Union[npt.NDArray[np.uint8], Tuple[npt.NDArray[np.uint8], Dict[str, bytes]]]: ...
+async def read_async(path: PathOrFile, *, metadata: bool, out: Optional[npt.NDArray[np.uint8]] = None) -> Union[npt.NDArray[np.uint8], Tuple[npt.NDArray[np.uint8], Dict[str, bytes]]]: ...
 
 async def write_async(
-    path: Union[str, Path],
+    path: PathOrFile,
     image: npt.NDArray[np.uint8],
     effort: int = 7,
     distance: float = 1.0,
@@ -128,15 +194,15 @@ async def write_async(
 
 class JXL(_JXL):
     @overload
-    def read(self, path: Union[str, Path], *, metadata: Literal[False] = False) -> npt.NDArray[np.uint8]: ...
+    def read(self, path: PathOrFile, *, metadata: Literal[False] = False, out: Optional[npt.NDArray[np.uint8]] = None) -> npt.NDArray[np.uint8]: ...
     @overload
-    def read(self, path: Union[str, Path], *, metadata: Literal[True]) -> Tuple[npt.NDArray[np.uint8], Dict[str, bytes]]: ...
+    def read(self, path: PathOrFile, *, metadata: Literal[True], out: Optional[npt.NDArray[np.uint8]] = None) -> Tuple[npt.NDArray[np.uint8], Dict[str, bytes]]: ...
     @overload
-    def read(self, path: Union[str, Path], *, metadata: bool) -> Union[npt.NDArray[np.uint8], Tuple[npt.NDArray[np.uint8], Dict[str, bytes]]]: ...
+    def read(self, path: PathOrFile, *, metadata: bool, out: Optional[npt.NDArray[np.uint8]] = None) -> Union[npt.NDArray[np.uint8], Tuple[npt.NDArray[np.uint8], Dict[str, bytes]]]: ...
 
     def write(
         self,
-        path: Union[str, Path],
+        path: PathOrFile,
         image: npt.NDArray[np.uint8],
         effort: Optional[int] = None,
         distance: Optional[float] = None,
@@ -148,10 +214,10 @@ class JXL(_JXL):
         jumbf: Optional[bytes] = None,
     ) -> None: ...
 
-    def read_jpeg(self, path: Union[str, Path]) -> npt.NDArray[np.uint8]: ...
-    def write_jpeg(self, path: Union[str, Path], image: npt.NDArray[np.uint8], quality: int = 95) -> None: ...
-    def convert_jpeg_to_jxl(self, jpeg_path: Union[str, Path], jxl_path: Union[str, Path], effort: Optional[int] = None) -> None: ...
-    def convert_jxl_to_jpeg(self, jxl_path: Union[str, Path], jpeg_path: Union[str, Path]) -> None: ...
+    def read_jpeg(self, path: PathOrFile) -> npt.NDArray[np.uint8]: ...
+    def write_jpeg(self, path: PathOrFile, image: npt.NDArray[np.uint8], quality: int = 95) -> None: ...
+    def convert_jpeg_to_jxl(self, jpeg_path: PathOrFile, jxl_path: PathOrFile, effort: Optional[int] = None) -> None: ...
+    def convert_jxl_to_jpeg(self, jxl_path: PathOrFile, jpeg_path: PathOrFile) -> None: ...
     def __enter__(self) -> "JXL": ...
 
 class AsyncJXL(_JXL):
@@ -172,22 +238,38 @@ class AsyncJXL(_JXL):
     ) -> bytes: ...
 
     @overload
-    async def decode_async(self, data: bytes, *, metadata: Literal[False] = False) -> npt.NDArray[np.uint8]: ...
+    async def decode_async(self, data: Buffer, *, metadata: Literal[False] = False, out: Optional[npt.NDArray[np.uint8]] = None) -> npt.NDArray[np.uint8]: ...
+    @overload
+    async def decode_async(self, data: Buffer, *, metadata: Literal[True], out: Optional[npt.NDArray[np.uint8]] = None) -> Tuple[npt.NDArray[np.uint8], Dict[str, bytes]]: ...
+    @overload
+    async def decode_async(self, data: Buffer, *, metadata: bool, out: Optional[npt.NDArray[np.uint8]] = None) -> Union[npt.NDArray[np.uint8], Tuple[npt.NDArray[np.uint8], Dict[str, bytes]]]: ...
+
+    async def encode_many_async(
+        self,
+        images: Sequence[npt.NDArray[np.uint8]],
+        effort: Optional[int] = None,
+        distance: Optional[float] = None,
+        lossless: Optional[bool] = None,
+        decoding_speed: Optional[int] = None,
+    ) -> List[bytes]: ...
+
+    @overload
+    async def decode_many_async(self, data: Sequence[Buffer], *, metadata: Literal[False] = False) -> List[npt.NDArray[np.uint8]]: ...
     @overload
-    async def decode_async(self, data: bytes, *, metadata: Literal[True]) -> Tuple[npt.NDArray[np.uint8], Dict[str, bytes]]: ...
+    async def decode_many_async(self, data: Sequence[Buffer], *, metadata: Literal[True]) -> List[Tuple[npt.NDArray[np.uint8], Dict[str, bytes]]]: ...
     @overload
-    async def decode_async(self, data: bytes, *, metadata: bool) -> Union[npt.NDArray[np.uint8], Tuple[npt.NDArray[np.uint8], Dict[str, bytes]]]: ...
+    async def decode_many_async(self, data: Sequence[Buffer], *, metadata: bool) -> List[Union[npt.NDArray[np.uint8], Tuple[npt.NDArray[np.uint8], Dict[str, bytes]]]]: ...
 
     @overload
-    async def read_async(self, path: Union[str, Path], *, metadata: Literal[False] = False) -> npt.NDArray[np.uint8]: ...
+    async def read_async(self, path: PathOrFile, *, metadata: Literal[False] = False, out: Optional[npt.NDArray[np.uint8]] = None) -> npt.NDArray[np.uint8]: ...
     @overload
-    async def read_async(self, path: Union[str, Path], *, metadata: Literal[True]) -> Tuple[npt.NDArray[np.uint8], Dict[str, bytes]]: ...
+    async def read_async(self, path: PathOrFile, *, metadata: Literal[True], out: Optional[npt.NDArray[np.uint8]] = None) -> Tuple[npt.NDArray[np.uint8], Dict[str, bytes]]: ...
     @overload
-    async def read_async(self, path: Union[str, Path], *, metadata: bool) -> Union[npt.NDArray[np.uint8], Tuple[npt.NDArray[np.uint8], Dict[str, bytes]]]: ...
+    async def read_async(self, path: PathOrFile, *, metadata: bool, out: Optional[npt.NDArray[np.uint8]] = None) -> Union[npt.NDArray[np.uint8], Tuple[npt.NDArray[np.uint8], Dict[str, bytes]]]: ...
 
     async def write_async(
         self,
-        path: Union[str, Path],
+        path: PathOrFile,
         image: npt.NDArray[np.uint8],
         effort: Optional[int] = None,
         distance: Optional[float] = None,
@@ -200,25 +282,29 @@ class AsyncJXL(_JXL):
     ) -> None: ...
 
     async def encode_jpeg_async(self, input: npt.NDArray[np.uint8], quality: int = 95) -> bytes: ...
-    async def decode_jpeg_async(self, data: bytes) -> npt.NDArray[np.uint8]: ...
-    async def read_jpeg_async(self, path: Union[str, Path]) -> npt.NDArray[np.uint8]: ...
-    async def write_jpeg_async(self, path: Union[str, Path], image: npt.NDArray[np.uint8], quality: int = 95) -> None: ...
-    async def jpeg_to_jxl_async(self, data: bytes, effort: Optional[int] = None) -> bytes: ...
-    async def jxl_to_jpeg_async(self, data: bytes) -> bytes: ...
-    async def convert_jpeg_to_jxl_async(self, jpeg_path: Union[str, Path], jxl_path: Union[str, Path], effort: Optional[int] = None) -> None: ...
-    async def convert_jxl_to_jpeg_async(self, jxl_path: Union[str, Path], jpeg_path: Union[str, Path]) -> None: ...
+    async def decode_jpeg_async(self, data: Buffer) -> npt.NDArray[np.uint8]: ...
+    async def read_jpeg_async(self, path: PathOrFile) -> npt.NDArray[np.uint8]: ...
+    async def write_jpeg_async(self, path: PathOrFile, image: npt.NDArray[np.uint8], quality: int = 95) -> None: ...
+    async def jpeg_to_jxl_async(self, data: Buffer, effort: Optional[int] = None) -> bytes: ...
+    async def jxl_to_jpeg_async(self, data: Buffer) -> bytes: ...
+    async def jpeg_to_jxl_many_async(self, data: Sequence[Buffer], effort: Optional[int] = None) -> List[bytes]: ...
+    async def convert_jpeg_to_jxl_async(self, jpeg_path: PathOrFile, jxl_path: PathOrFile, effort: Optional[int] = None) -> None: ...
+    async def convert_jxl_to_jpeg_async(self, jxl_path: PathOrFile, jpeg_path: PathOrFile) -> None: ...
 
 async def encode_jpeg_async(input: npt.NDArray[np.uint8], quality: int = 95) -> bytes: ...
-async def decode_jpeg_async(data: bytes) -> npt.NDArray[np.uint8]: ...
-async def jpeg_to_jxl_async(data: bytes, effort: int = 7) -> bytes: ...
-async def jxl_to_jpeg_async(data: bytes) -> bytes: ...
-
-def read_jpeg(path: Union[str, Path]) -> npt.NDArray[np.uint8]: ...
-def write_jpeg(path: Union[str, Path], image: npt.NDArray[np.uint8], quality: int = 95) -> None: ...
-async def read_jpeg_async(path: Union[str, Path]) -> npt.NDArray[np.uint8]: ...
-async def write_jpeg_async(path: Union[str, Path], image: npt.NDArray[np.uint8], quality: int = 95) -> None: ...
-
-def convert_jpeg_to_jxl(jpeg_path: Union[str, Path], jxl_path: Union[str, Path], effort: int = 7) -> None: ...
-def convert_jxl_to_jpeg(jxl_path: Union[str, Path], jpeg_path: Union[str, Path]) -> None: ...
-async def convert_jpeg_to_jxl_async(jpeg_path: Union[str, Path], jxl_path: Union[str, Path], effort: int = 7) -> None: ...
-async def convert_jxl_to_jpeg_async(jxl_path: Union[str, Path], jpeg_path: Union[str, Path]) -> None: ...
+async def decode_jpeg_async(data: Buffer) -> npt.NDArray[np.uint8]: ...
+async def jpeg_to_jxl_async(data: Buffer, effort: int = 7) -> bytes: ...
+async def jxl_to_jpeg_async(data: Buffer) -> bytes: ...
+async def jpeg_to_jxl_many_async(data: Sequence[Buffer], effort: int = 7) -> List[bytes]: ...
+def jpeg_to_jxl_batch(data: Iterable[Buffer], effort: int = 7, *, prefetch: int = 2) -> Iterator[bytes]: ...
+def decode_jpeg_batch(data: Iterable[Buffer], workers: Optional[int] = None) -> List[npt.NDArray[np.uint8]]: ...
+
+def read_jpeg(path: PathOrFile) -> npt.NDArray[np.uint8]: ...
+def write_jpeg(path: PathOrFile, image: npt.NDArray[np.uint8], quality: int = 95) -> None: ...
+async def read_jpeg_async(path: PathOrFile) -> npt.NDArray[np.uint8]: ...
+async def write_jpeg_async(path: PathOrFile, image: npt.NDArray[np.uint8], quality: int = 95) -> None: ...
+
+def convert_jpeg_to_jxl(jpeg_path: PathOrFile, jxl_path: PathOrFile, effort: int = 7) -> None: ...
+def convert_jxl_to_jpeg(jxl_path: PathOrFile, jpeg_path: PathOrFile) -> None: ...
+async def convert_jpeg_to_jxl_async(jpeg_path: PathOrFile, jxl_path: PathOrFile, effort: int = 7) -> None: ...
+async def convert_jxl_to_jpeg_async(jxl_path: PathOrFile, jpeg_path: PathOrFile) -> None: ...
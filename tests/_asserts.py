@@ -0,0 +1,22 @@
+"""Array assertions shared by the test modules."""
+
+import numpy as np
+
+
+def assert_same_layout(actual, expected):
+    """Assert two arrays have the same shape and dtype, in a single check."""
+    assert (actual.shape, actual.dtype) == (expected.shape, expected.dtype), (
+        f"got {actual.shape} {actual.dtype}, expected {expected.shape} {expected.dtype}"
+    )
+
+
+def assert_bytes_equal(actual, expected):
+    """Assert two arrays are identical: same shape, dtype and pixel values.
+
+    np.array_equal compares in one vectorized pass, several times faster than
+    np.testing.assert_array_equal on full-size images; the latter only runs on
+    a mismatch, to produce its readable diff.
+    """
+    assert_same_layout(actual, expected)
+    if not np.array_equal(actual, expected):
+        np.testing.assert_array_equal(actual, expected)
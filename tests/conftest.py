@@ -1,3 +1,4 @@
+import io
 from pathlib import Path
 
 import numpy as np
@@ -6,6 +7,11 @@ import pytest
 import pylibjxl
 
 
+def _readonly(arr):
+    arr.setflags(write=False)
+    return arr
+
+
 @pytest.fixture(scope="session")
 def real_image_path():
     """Path to the real test image."""
@@ -22,16 +28,77 @@ def real_image_bytes(real_image_path):
     return real_image_path.read_bytes()
 
 
+@pytest.fixture(scope="class")
+def shared_tmp(tmp_path_factory):
+    """One temporary directory shared by all tests of a class.
+
+    Cheaper than a fresh tmp_path per test; tests using it must pick file
+    names that no other test in the class uses.
+    """
+    return tmp_path_factory.mktemp("shared")
+
+
 @pytest.fixture(scope="session")
 def sample_image(real_image_bytes):
-    """Decoded numpy array of the test image (RGB)."""
-    return pylibjxl.decode_jpeg(real_image_bytes)
+    """Decoded numpy array of the test image (RGB).
+
+    Decoded once per session and read-only, so no test can alter it for the rest.
+    """
+    return _readonly(pylibjxl.decode_jpeg(real_image_bytes))
 
 
 @pytest.fixture(scope="session")
 def sample_image_rgba(sample_image):
     """Decoded numpy array of the test image with Alpha channel (RGBA)."""
-    # Create an alpha channel (255 fully opaque)
-    h, w, c = sample_image.shape
-    alpha = np.full((h, w, 1), 255, dtype=np.uint8)
-    return np.concatenate([sample_image, alpha], axis=2)
+    # Fill the RGBA buffer in place rather than concatenating a separate alpha plane
+    h, w, _ = sample_image.shape
+    rgba = np.empty((h, w, 4), dtype=np.uint8)
+    rgba[..., :3] = sample_image
+    rgba[..., 3] = 255  # fully opaque
+    return _readonly(rgba)
+
+
+@pytest.fixture(scope="session")
+def sample_image_flipped(sample_image):
+    """The test image flipped upside down, as a second distinct image."""
+    return _readonly(np.ascontiguousarray(sample_image[::-1]))
+
+
+@pytest.fixture(scope="session")
+def sample_jxl(sample_image):
+    """JXL bytes (effort 3) of the test image, encoded once per session."""
+    return pylibjxl.encode(sample_image, effort=3)
+
+
+@pytest.fixture(scope="session", params=["rgb", "rgba"])
+def lossless_roundtrip(request, sample_image, sample_image_rgba):
+    """(image, lossless effort-4 JXL bytes), encoded once per session for each layout."""
+    img = sample_image if request.param == "rgb" else sample_image_rgba
+    return img, pylibjxl.encode(img, effort=4, lossless=True)
+
+
+@pytest.fixture(scope="session")
+def sample_pil(sample_image):
+    """PIL view of the test image, built once so Pillow benchmarks time only the codec."""
+    from PIL import Image
+
+    return Image.fromarray(sample_image)
+
+
+@pytest.fixture(scope="session")
+def pylibjxl_rgb_of_real_image(real_image_bytes):
+    """The test JPEG as decoded by this build's decode_jpeg, never taken from the cache."""
+    return _readonly(pylibjxl.decode_jpeg(real_image_bytes))
+
+
+@pytest.fixture(scope="session")
+def pil_rgb_of_real_image(real_image_bytes):
+    """The test JPEG as decoded by Pillow, for comparison against pylibjxl's decode."""
+    from PIL import Image
+
+    with Image.open(io.BytesIO(real_image_bytes)) as im:
+        # Have libjpeg-turbo decode straight to full-size RGB, no convert() pass
+        im.draft("RGB", im.size)
+        im.load()
+        assert im.mode == "RGB"
+        return _readonly(np.asarray(im))
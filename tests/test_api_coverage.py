@@ -1,5 +1,6 @@
 import numpy as np
 import pytest
+from _asserts import assert_same_layout
 
 import pylibjxl
 
@@ -36,8 +37,7 @@ class TestJXLClassCoverage:
             decoded = jxl.read_jpeg(path)
             # JPEG is lossy, so shapes match but pixels might differ slightly.
             # Just asserting shape/dtype matches input.
-            assert decoded.shape == img.shape
-            assert decoded.dtype == img.dtype
+            assert_same_layout(decoded, img)
 
     def test_conversion_roundtrip(self, tmp_path, sample_image):
         # JPEG -> JXL -> JPEG (lossless transcoding)
@@ -61,7 +61,7 @@ class TestJXLClassCoverage:
             # Verify contents are similar (JPEG encoding is lossy, but transcoding should be consistent)
             # Just checking if we can read it back
             final_img = jxl.read_jpeg(rec_jpg_path)
-            assert final_img.shape == img.shape
+            assert_same_layout(final_img, img)
 
 
 class TestAsyncJXLClassCoverage:
@@ -99,7 +99,7 @@ class TestAsyncJXLClassCoverage:
             await jxl.write_jpeg_async(path, img, quality=80)
             assert path.exists()
             decoded = await jxl.read_jpeg_async(path)
-            assert decoded.shape == img.shape
+            assert_same_layout(decoded, img)
 
     @pytest.mark.asyncio
     async def test_transcode_async_in_memory(self, real_image_bytes):
@@ -19,3 +19,29 @@ def test_encoder_version():
     v = pylibjxl.encoder_version()
     assert v > 0
     print(f"Encoder version: {v}")
+
+
+def _cpu_flags():
+    """CPU feature flags from /proc/cpuinfo (x86 "flags", arm "Features"); empty elsewhere."""
+    try:
+        with open("/proc/cpuinfo") as f:
+            for line in f:
+                key, _, value = line.partition(":")
+                if key.strip() in ("flags", "Features"):
+                    return set(value.split())
+    except OSError:
+        pass
+    return set()
+
+
+def test_simd_targets():
+    targets = pylibjxl.simd_targets()
+    assert targets
+    assert all(isinstance(t, str) for t in targets)
+    # The list depends on the CPU as well as the build, so only require a SIMD
+    # target the CPU itself reports; a build stuck on baseline code fails here.
+    flags = _cpu_flags()
+    if "avx2" in flags:
+        assert "AVX2" in targets
+    if "asimd" in flags:
+        assert any(t.startswith("NEON") for t in targets)
@@ -0,0 +1,130 @@
+import numpy as np
+import pytest
+from _asserts import assert_bytes_equal
+
+import pylibjxl
+
+
+@pytest.fixture(scope="module")
+def tiles(sample_image):
+    """A few small, distinct crops of the test image."""
+    return [
+        np.ascontiguousarray(sample_image[y : y + 64, x : x + 96])
+        for y, x in [(0, 0), (100, 200), (400, 800)]
+    ]
+
+
+@pytest.fixture(scope="module")
+def tile_jpegs(tiles):
+    """The tiles as quality-90 JPEGs, encoded once for the transcode tests."""
+    return [pylibjxl.encode_jpeg(t, quality=90) for t in tiles]
+
+
+def test_encode_many_matches_encode(tiles):
+    blobs = pylibjxl.encode_many(tiles, effort=1, lossless=True)
+    assert isinstance(blobs, list)
+    assert len(blobs) == len(tiles)
+    for blob, tile in zip(blobs, tiles):
+        assert_bytes_equal(pylibjxl.decode(blob), tile)
+
+
+def test_decode_many_roundtrip(tiles):
+    blobs = [pylibjxl.encode(t, effort=1, lossless=True) for t in tiles]
+    decoded = pylibjxl.decode_many(blobs)
+    assert len(decoded) == len(tiles)
+    for result, tile in zip(decoded, tiles):
+        assert_bytes_equal(result, tile)
+
+
+def test_decode_many_metadata(tiles):
+    blob = pylibjxl.encode(tiles[0], effort=1, exif=b"exif-data")
+    results = pylibjxl.decode_many([blob, bytearray(blob)], metadata=True)
+    for img, meta in results:
+        assert img.shape == tiles[0].shape
+        assert meta["exif"] == b"exif-data"
+
+
+def test_empty_batches():
+    assert pylibjxl.encode_many([]) == []
+    assert pylibjxl.decode_many([]) == []
+    assert pylibjxl.jpeg_to_jxl_many([]) == []
+
+
+def test_encode_many_rejects_bad_shape(tiles):
+    with pytest.raises(ValueError):
+        pylibjxl.encode_many([tiles[0], np.zeros((8, 8), dtype=np.uint8)])
+
+
+def test_decode_many_invalid_raises(tiles):
+    blob = pylibjxl.encode(tiles[0], effort=1)
+    with pytest.raises(RuntimeError):
+        pylibjxl.decode_many([blob, b"not a jxl file"])
+
+
+def test_jpeg_to_jxl_many_roundtrip(tile_jpegs):
+    jpegs = tile_jpegs
+    jxls = pylibjxl.jpeg_to_jxl_many(jpegs, effort=1)
+    assert [pylibjxl.jxl_to_jpeg(j) for j in jxls] == jpegs
+
+
+def test_context_batch_methods(tiles):
+    with pylibjxl.JXL(effort=1, lossless=True) as jxl:
+        decoded = jxl.decode_many(jxl.encode_many(tiles))
+        jpegs = [jxl.encode_jpeg(t) for t in tiles]
+        jxls = jxl.jpeg_to_jxl_many(jpegs)
+    for result, tile in zip(decoded, tiles):
+        assert_bytes_equal(result, tile)
+    assert len(jxls) == len(jpegs)
+
+
+def test_closed_encode_many_raises(tiles):
+    jxl = pylibjxl.JXL()
+    jxl.close()
+    with pytest.raises(RuntimeError, match="closed"):
+        jxl.encode_many(tiles)
+
+
+@pytest.mark.asyncio
+async def test_async_batch(tiles):
+    blobs = await pylibjxl.encode_many_async(tiles, effort=1, lossless=True)
+    decoded = await pylibjxl.decode_many_async(blobs)
+    for result, tile in zip(decoded, tiles):
+        assert_bytes_equal(result, tile)
+
+    async with pylibjxl.AsyncJXL(effort=1, lossless=True) as jxl:
+        blobs = await jxl.encode_many_async(tiles)
+        decoded = await jxl.decode_many_async(blobs)
+        jpegs = [pylibjxl.encode_jpeg(t) for t in tiles]
+        jxls = await jxl.jpeg_to_jxl_many_async(jpegs)
+    for result, tile in zip(decoded, tiles):
+        assert_bytes_equal(result, tile)
+    assert [pylibjxl.jxl_to_jpeg(j) for j in jxls] == jpegs
+    transcoded = await pylibjxl.jpeg_to_jxl_many_async(jpegs, effort=1)
+    assert [pylibjxl.jxl_to_jpeg(j) for j in transcoded] == jpegs
+
+
+def test_jpeg_to_jxl_batch_matches_single(tile_jpegs):
+    jpegs = tile_jpegs
+    results = list(pylibjxl.jpeg_to_jxl_batch(iter(jpegs), effort=1, prefetch=1))
+    assert results == [pylibjxl.jpeg_to_jxl(j, effort=1) for j in jpegs]
+
+
+def test_jpeg_to_jxl_batch_invalid_prefetch():
+    with pytest.raises(ValueError, match="prefetch"):
+        pylibjxl.jpeg_to_jxl_batch([], prefetch=0)
+
+
+def test_decode_jpeg_batch_matches_single(tile_jpegs):
+    jpegs = tile_jpegs
+    decoded = pylibjxl.decode_jpeg_batch(jpegs, workers=2)
+    assert len(decoded) == len(jpegs)
+    for result, jpeg in zip(decoded, jpegs):
+        assert_bytes_equal(result, pylibjxl.decode_jpeg(jpeg))
+    assert pylibjxl.decode_jpeg_batch([]) == []
+
+
+def test_decode_jpeg_batch_invalid(tile_jpegs):
+    with pytest.raises(ValueError, match="workers"):
+        pylibjxl.decode_jpeg_batch([], workers=0)
+    with pytest.raises(RuntimeError):
+        pylibjxl.decode_jpeg_batch([tile_jpegs[0], b"not a jpeg"])
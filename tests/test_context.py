@@ -1,5 +1,8 @@
-import numpy as np
+import asyncio
+import threading
+
 import pytest
+from _asserts import assert_bytes_equal
 
 import pylibjxl
 
@@ -11,25 +14,24 @@ class TestJXL:
         with pylibjxl.JXL(effort=4) as jxl:
             data = jxl.encode(img, lossless=True)
             result = jxl.decode(data)
-            np.testing.assert_array_equal(result, img)
+            assert_bytes_equal(result, img)
 
     def test_context_lifecycle(self):
         with pylibjxl.JXL() as jxl:
             assert not jxl.closed
         assert jxl.closed
 
-    def test_multiple_operations(self, sample_image):
+    def test_multiple_operations(self, sample_image, sample_image_flipped):
         img1 = sample_image
-        # Create a second image by flipping the first one
-        img2 = np.ascontiguousarray(np.flipud(sample_image))
+        img2 = sample_image_flipped
 
         with pylibjxl.JXL(effort=4) as jxl:
             d1 = jxl.encode(img1, lossless=True)
             d2 = jxl.encode(img2, lossless=True)
             r1 = jxl.decode(d1)
             r2 = jxl.decode(d2)
-            np.testing.assert_array_equal(r1, img1)
-            np.testing.assert_array_equal(r2, img2)
+            assert_bytes_equal(r1, img1)
+            assert_bytes_equal(r2, img2)
 
     def test_per_call_override(self, sample_image):
         img = sample_image
@@ -39,6 +41,13 @@ class TestJXL:
             assert len(lossy) > 0
             assert len(lossless) > 0
 
+    def test_write_uses_session_defaults(self, tmp_path, sample_image):
+        path = tmp_path / "defaults.jxl"
+        with pylibjxl.JXL(effort=4, lossless=True) as jxl:
+            jxl.write(path, sample_image)
+            assert path.read_bytes() == jxl.encode(sample_image)
+            assert_bytes_equal(jxl.read(path), sample_image)
+
     def test_closed_encode_raises(self, sample_image):
         jxl = pylibjxl.JXL()
         jxl.close()
@@ -72,18 +81,50 @@ class TestAsyncJXL:
         async with pylibjxl.AsyncJXL(effort=4) as jxl:
             data = await jxl.encode_async(img, lossless=True)
             result = await jxl.decode_async(data)
-            np.testing.assert_array_equal(result, img)
+            assert_bytes_equal(result, img)
         assert jxl.closed
 
     @pytest.mark.asyncio
-    async def test_async_multiple_operations(self, sample_image):
+    async def test_close_during_inflight_encode(self, sample_image):
+        """Closing waits for a running executor job instead of freeing its encoder."""
+        jxl = pylibjxl.AsyncJXL(effort=9)
+        loop = asyncio.get_running_loop()
+        started = threading.Event()
+        closed = threading.Event()
+
+        def running_job():
+            started.set()
+            return jxl.encode(sample_image)
+
+        def queued_job():
+            closed.wait()
+            return jxl.encode(sample_image)
+
+        running = loop.run_in_executor(None, running_job)
+        queued = loop.run_in_executor(None, queued_job)
+        try:
+            await loop.run_in_executor(None, started.wait)
+            jxl.close()  # what leaving `async with` does with jobs still in flight
+            assert jxl.closed
+        finally:
+            closed.set()
+
+        data = await running
+        assert pylibjxl.decode(data).shape == sample_image.shape
+        # A job that had not started by close() finds the codec closed.
+        with pytest.raises(RuntimeError, match="closed"):
+            await queued
+
+    @pytest.mark.asyncio
+    async def test_async_multiple_operations(self, sample_image, sample_image_flipped):
         img1 = sample_image
-        img2 = np.ascontiguousarray(np.flipud(sample_image))
+        img2 = sample_image_flipped
 
         async with pylibjxl.AsyncJXL(effort=4) as jxl:
-            d1 = await jxl.encode_async(img1, lossless=True)
-            d2 = await jxl.encode_async(img2, lossless=True)
-            r1 = await jxl.decode_async(d1)
-            r2 = await jxl.decode_async(d2)
-            np.testing.assert_array_equal(r1, img1)
-            np.testing.assert_array_equal(r2, img2)
+            d1, d2 = await asyncio.gather(
+                jxl.encode_async(img1, lossless=True),
+                jxl.encode_async(img2, lossless=True),
+            )
+            r1, r2 = await asyncio.gather(jxl.decode_async(d1), jxl.decode_async(d2))
+            assert_bytes_equal(r1, img1)
+            assert_bytes_equal(r2, img2)
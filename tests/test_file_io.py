@@ -1,5 +1,8 @@
+import io
+
 import numpy as np
 import pytest
+from _asserts import assert_bytes_equal
 
 import pylibjxl
 
@@ -7,43 +10,77 @@ import pylibjxl
 
 
 class TestReadWrite:
-    def test_write_read_roundtrip(self, tmp_path, sample_image):
+    def test_write_read_roundtrip(self, shared_tmp, sample_image):
         img = sample_image
-        path = tmp_path / "test.jxl"
+        path = shared_tmp / "test.jxl"
         pylibjxl.write(path, img, effort=4, lossless=True)
         assert path.exists()
         result = pylibjxl.read(path)
-        np.testing.assert_array_equal(result, img)
+        assert_bytes_equal(result, img)
 
-    def test_write_read_rgba(self, tmp_path, sample_image_rgba):
+    def test_write_read_rgba(self, shared_tmp, sample_image_rgba):
         img = sample_image_rgba
-        path = tmp_path / "test_rgba.jxl"
+        path = shared_tmp / "test_rgba.jxl"
         pylibjxl.write(path, img, effort=4, lossless=True)
         result = pylibjxl.read(path)
         # JXL lossless should preserve exact values including alpha
-        np.testing.assert_array_equal(result, img)
+        assert_bytes_equal(result, img)
 
-    def test_write_creates_parent_dirs(self, tmp_path, sample_image):
+    def test_write_creates_parent_dirs(self, shared_tmp, sample_image):
         img = sample_image
-        path = tmp_path / "a" / "b" / "c" / "test.jxl"
+        path = shared_tmp / "a" / "b" / "c" / "test.jxl"
         pylibjxl.write(path, img, effort=4, lossless=True)
         assert path.exists()
         result = pylibjxl.read(path)
-        np.testing.assert_array_equal(result, img)
+        assert_bytes_equal(result, img)
 
     def test_read_nonexistent_raises(self):
-        with pytest.raises(FileNotFoundError):
+        with pytest.raises(FileNotFoundError, match="No such file"):
             pylibjxl.read("/nonexistent/path.jxl")
 
-    def test_write_lossy(self, tmp_path, sample_image):
+    def test_read_empty_file_raises(self, shared_tmp):
+        path = shared_tmp / "empty.jxl"
+        path.write_bytes(b"")
+        with pytest.raises(RuntimeError):
+            pylibjxl.read(path)
+
+    def test_write_lossy(self, shared_tmp, sample_image):
         img = sample_image
-        path = tmp_path / "lossy.jxl"
+        path = shared_tmp / "lossy.jxl"
         pylibjxl.write(path, img, effort=4, distance=1.0)
         result = pylibjxl.read(path)
         assert result.dtype == np.uint8
         # Lossy compression: exact values will differ, but shape/dtype should match
 
 
+# ─── File Objects ───────────────────────────────────────────────────────────────
+
+
+class TestFileObjects:
+    """read/write on in-memory file objects, with no filesystem involved."""
+
+    def test_bytesio_roundtrip(self, sample_image):
+        buf = io.BytesIO()
+        pylibjxl.write(buf, sample_image, effort=4, lossless=True)
+        buf.seek(0)
+        assert_bytes_equal(pylibjxl.read(buf), sample_image)
+
+    def test_context_bytesio_roundtrip(self, sample_image):
+        buf = io.BytesIO()
+        with pylibjxl.JXL(effort=4) as jxl:
+            jxl.write(buf, sample_image, lossless=True)
+            buf.seek(0)
+            assert_bytes_equal(jxl.read(buf), sample_image)
+
+    def test_convert_between_file_objects(self, real_image_bytes):
+        jxl_buf = io.BytesIO()
+        pylibjxl.convert_jpeg_to_jxl(io.BytesIO(real_image_bytes), jxl_buf, effort=1)
+        jxl_buf.seek(0)
+        jpeg_buf = io.BytesIO()
+        pylibjxl.convert_jxl_to_jpeg(jxl_buf, jpeg_buf)
+        assert jpeg_buf.getvalue() == real_image_bytes
+
+
 # ─── Context Manager: read/write ──────────────────────────────────────────────
 
 
@@ -54,11 +91,11 @@ class TestJXLReadWrite:
         with pylibjxl.JXL(effort=4) as jxl:
             jxl.write(path, img, lossless=True)
             result = jxl.read(path)
-            np.testing.assert_array_equal(result, img)
+            assert_bytes_equal(result, img)
 
-    def test_context_multiple_files(self, tmp_path, sample_image):
+    def test_context_multiple_files(self, tmp_path, sample_image, sample_image_flipped):
         img1 = sample_image
-        img2 = np.ascontiguousarray(np.flipud(sample_image))
+        img2 = sample_image_flipped
         p1 = tmp_path / "img1.jxl"
         p2 = tmp_path / "img2.jxl"
         with pylibjxl.JXL(effort=4) as jxl:
@@ -66,8 +103,8 @@ class TestJXLReadWrite:
             jxl.write(p2, img2, lossless=True)
             r1 = jxl.read(p1)
             r2 = jxl.read(p2)
-            np.testing.assert_array_equal(r1, img1)
-            np.testing.assert_array_equal(r2, img2)
+            assert_bytes_equal(r1, img1)
+            assert_bytes_equal(r2, img2)
 
     def test_closed_read_raises(self, tmp_path, sample_image):
         img = sample_image
@@ -96,7 +133,7 @@ class TestAsyncReadWrite:
         await pylibjxl.write_async(path, img, effort=4, lossless=True)
         assert path.exists()
         result = await pylibjxl.read_async(path)
-        np.testing.assert_array_equal(result, img)
+        assert_bytes_equal(result, img)
 
 
 # ─── Async Context Manager ─────────────────────────────────────────────────────
@@ -110,5 +147,5 @@ class TestAsyncJXLReadWrite:
         async with pylibjxl.AsyncJXL(effort=4) as jxl:
             await jxl.write_async(path, img, lossless=True)
             result = await jxl.read_async(path)
-            np.testing.assert_array_equal(result, img)
+            assert_bytes_equal(result, img)
         assert jxl.closed
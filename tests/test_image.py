@@ -1,4 +1,6 @@
 import numpy as np
+import pytest
+from _asserts import assert_bytes_equal
 
 import pylibjxl
 
@@ -40,15 +42,64 @@ def test_encode_decode_rgba(sample_image_rgba):
     # Basic check - alpha channel should be preserved (though lossy)
 
 
-def test_encode_decode_lossless(sample_image):
+def test_encode_decode_lossless(lossless_roundtrip):
     """Test JXL lossless encoding/decoding."""
-    img = sample_image
-
-    # Encode lossless
-    jxl_data = pylibjxl.encode(img, effort=4, lossless=True)
+    img, jxl_data = lossless_roundtrip
 
     # Decode
     decoded_img = pylibjxl.decode(jxl_data)
 
     # Should be EXACTLY the same
-    np.testing.assert_array_equal(decoded_img, img)
+    assert_bytes_equal(decoded_img, img)
+
+
+def test_decode_accepts_buffer_protocol(lossless_roundtrip):
+    """decode() accepts any bytes-like object, not only bytes."""
+    img, jxl_data = lossless_roundtrip
+
+    for buf in (bytearray(jxl_data), memoryview(jxl_data)):
+        assert_bytes_equal(pylibjxl.decode(buf), img)
+
+
+def test_decode_into_out(lossless_roundtrip):
+    """decode(out=...) writes into the given array and returns it."""
+    img, jxl_data = lossless_roundtrip
+    out = np.empty_like(img)
+
+    result = pylibjxl.decode(jxl_data, out=out)
+    assert result is out
+    assert_bytes_equal(out, img)
+
+    with pylibjxl.JXL() as jxl:
+        out[:] = 0
+        result, meta = jxl.decode(jxl_data, metadata=True, out=out)
+        assert result is out
+        assert meta == {}
+        assert_bytes_equal(out, img)
+
+
+def test_decode_out_mismatch_raises(sample_image):
+    jxl_data = pylibjxl.encode(sample_image, effort=1)
+    h, w, _ = sample_image.shape
+
+    with pytest.raises(ValueError, match="shape"):
+        pylibjxl.decode(jxl_data, out=np.empty((h, w, 4), dtype=np.uint8))
+    with pytest.raises(TypeError):
+        pylibjxl.decode(jxl_data, out=np.empty((h, w, 3), dtype=np.float32))
+
+    readonly = np.empty_like(sample_image)
+    readonly.setflags(write=False)
+    with pytest.raises(TypeError):
+        pylibjxl.decode(jxl_data, out=readonly)
+
+
+def test_encode_accepts_readonly_array(sample_image):
+    """Read-only arrays (e.g. np.frombuffer over bytes) are encoded without a copy."""
+    readonly = np.frombuffer(sample_image.tobytes(), dtype=np.uint8).reshape(
+        sample_image.shape
+    )
+    assert not readonly.flags.writeable
+
+    jxl_data = pylibjxl.encode(readonly, effort=4, lossless=True)
+    assert_bytes_equal(pylibjxl.decode(jxl_data), sample_image)
+    assert pylibjxl.encode_jpeg(readonly).startswith(b"\xff\xd8")
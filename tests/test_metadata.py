@@ -30,55 +30,43 @@ XMP_PAYLOAD = (
 JUMBF_PAYLOAD = b"\x00\x00\x00\x1fjumb\x00\x00\x00\x11jumd\x00\x11\x00\x10"
 
 
-# ─── Free Function: encode / decode roundtrip ───────────────────────────────────
+@pytest.fixture(scope="module")
+def jxl():
+    """One JXL codec shared by the module's context-manager tests."""
+    with pylibjxl.JXL(effort=4) as codec:
+        yield codec
 
 
-class TestMetadataRoundtrip:
-    """Test that metadata survives encode → decode roundtrip."""
+@pytest.fixture(scope="module")
+def async_jxl():
+    """One AsyncJXL codec shared by the module's async context tests."""
+    with pylibjxl.AsyncJXL(effort=4) as codec:
+        yield codec
 
-    def test_exif_roundtrip(self, sample_image):
-        img = sample_image
-        data = pylibjxl.encode(img, exif=EXIF_PAYLOAD)
-        result, meta = pylibjxl.decode(data, metadata=True)
-        assert result.shape == img.shape
-        assert "exif" in meta
-        assert meta["exif"] == EXIF_PAYLOAD
 
-    def test_xmp_roundtrip(self, sample_image):
-        img = sample_image
-        data = pylibjxl.encode(img, xmp=XMP_PAYLOAD)
-        result, meta = pylibjxl.decode(data, metadata=True)
-        assert result.shape == img.shape
-        assert "xmp" in meta
-        assert meta["xmp"] == XMP_PAYLOAD
+# ─── Free Function: encode / decode roundtrip ───────────────────────────────────
 
-    def test_jumbf_roundtrip(self, sample_image):
-        img = sample_image
-        data = pylibjxl.encode(img, jumbf=JUMBF_PAYLOAD)
-        result, meta = pylibjxl.decode(data, metadata=True)
-        assert result.shape == img.shape
-        assert "jumbf" in meta
-        assert meta["jumbf"] == JUMBF_PAYLOAD
 
-    def test_multiple_metadata_types(self, sample_image):
-        img = sample_image
-        data = pylibjxl.encode(img, exif=EXIF_PAYLOAD, xmp=XMP_PAYLOAD)
-        result, meta = pylibjxl.decode(data, metadata=True)
-        assert result.shape == img.shape
-        assert meta["exif"] == EXIF_PAYLOAD
-        assert meta["xmp"] == XMP_PAYLOAD
+class TestMetadataRoundtrip:
+    """Test that metadata survives encode → decode roundtrip."""
 
-    def test_all_three_metadata_types(self, sample_image):
-        img = sample_image
-        data = pylibjxl.encode(
-            img, exif=EXIF_PAYLOAD, xmp=XMP_PAYLOAD, jumbf=JUMBF_PAYLOAD
-        )
-        result, meta = pylibjxl.decode(data, metadata=True)
+    @pytest.mark.parametrize(
+        "meta",
+        [
+            {"exif": EXIF_PAYLOAD},
+            {"xmp": XMP_PAYLOAD},
+            {"jumbf": JUMBF_PAYLOAD},
+            {"exif": EXIF_PAYLOAD, "xmp": XMP_PAYLOAD},
+            {"exif": EXIF_PAYLOAD, "xmp": XMP_PAYLOAD, "jumbf": JUMBF_PAYLOAD},
+        ],
+        ids=["exif", "xmp", "jumbf", "exif+xmp", "all"],
+    )
+    def test_metadata_roundtrip(self, sample_image, meta):
+        img = sample_image
+        data = pylibjxl.encode(img, **meta)
+        result, decoded_meta = pylibjxl.decode(data, metadata=True)
         assert result.shape == img.shape
-        assert len(meta) == 3
-        assert meta["exif"] == EXIF_PAYLOAD
-        assert meta["xmp"] == XMP_PAYLOAD
-        assert meta["jumbf"] == JUMBF_PAYLOAD
+        assert decoded_meta == meta
 
 
 # ─── Backward Compatibility ─────────────────────────────────────────────────────
@@ -115,19 +103,17 @@ class TestBackwardCompat:
 class TestContextManagerMetadata:
     """Context manager encode/decode with metadata."""
 
-    def test_context_encode_with_metadata(self, sample_image):
+    def test_context_encode_with_metadata(self, jxl, sample_image):
         img = sample_image
-        with pylibjxl.JXL() as jxl:
-            data = jxl.encode(img, exif=EXIF_PAYLOAD, xmp=XMP_PAYLOAD)
-            result, meta = jxl.decode(data, metadata=True)
+        data = jxl.encode(img, exif=EXIF_PAYLOAD, xmp=XMP_PAYLOAD)
+        result, meta = jxl.decode(data, metadata=True)
         assert meta["exif"] == EXIF_PAYLOAD
         assert meta["xmp"] == XMP_PAYLOAD
 
-    def test_context_decode_without_metadata(self, sample_image):
+    def test_context_decode_without_metadata(self, jxl, sample_image):
         img = sample_image
-        with pylibjxl.JXL() as jxl:
-            data = jxl.encode(img, xmp=XMP_PAYLOAD)
-            result = jxl.decode(data)
+        data = jxl.encode(img, xmp=XMP_PAYLOAD)
+        result = jxl.decode(data)
         assert isinstance(result, np.ndarray)
 
 
@@ -137,27 +123,26 @@ class TestContextManagerMetadata:
 class TestFileIOMetadata:
     """File read/write with metadata."""
 
-    def test_write_read_with_exif(self, tmp_path, sample_image):
+    def test_write_read_with_exif(self, shared_tmp, sample_image):
         img = sample_image
-        path = tmp_path / "meta.jxl"
+        path = shared_tmp / "meta.jxl"
         pylibjxl.write(path, img, exif=EXIF_PAYLOAD)
         result, meta = pylibjxl.read(path, metadata=True)
         assert result.shape == img.shape
         assert meta["exif"] == EXIF_PAYLOAD
 
-    def test_write_read_no_metadata(self, tmp_path, sample_image):
+    def test_write_read_no_metadata(self, shared_tmp, sample_image):
         img = sample_image
-        path = tmp_path / "plain.jxl"
+        path = shared_tmp / "plain.jxl"
         pylibjxl.write(path, img)
         result = pylibjxl.read(path)
         assert isinstance(result, np.ndarray)
 
-    def test_context_write_read_metadata(self, tmp_path, sample_image):
+    def test_context_write_read_metadata(self, jxl, shared_tmp, sample_image):
         img = sample_image
-        path = tmp_path / "ctx_meta.jxl"
-        with pylibjxl.JXL() as jxl:
-            jxl.write(path, img, xmp=XMP_PAYLOAD)
-            result, meta = jxl.read(path, metadata=True)
+        path = shared_tmp / "ctx_meta.jxl"
+        jxl.write(path, img, xmp=XMP_PAYLOAD)
+        result, meta = jxl.read(path, metadata=True)
         assert meta["xmp"] == XMP_PAYLOAD
 
 
@@ -184,9 +169,8 @@ class TestAsyncMetadata:
         assert meta["xmp"] == XMP_PAYLOAD
 
     @pytest.mark.asyncio
-    async def test_async_context_metadata(self, sample_image):
+    async def test_async_context_metadata(self, async_jxl, sample_image):
         img = sample_image
-        async with pylibjxl.AsyncJXL() as jxl:
-            data = await jxl.encode_async(img, xmp=XMP_PAYLOAD)
-            result, meta = await jxl.decode_async(data, metadata=True)
+        data = await async_jxl.encode_async(img, xmp=XMP_PAYLOAD)
+        result, meta = await async_jxl.decode_async(data, metadata=True)
         assert meta["xmp"] == XMP_PAYLOAD
@@ -1,5 +1,6 @@
 import asyncio
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
@@ -22,18 +23,32 @@ async def test_async_encode_decode(sample_image):
 @pytest.mark.asyncio
 async def test_concurrent_processing(sample_image):
     img = sample_image
+    rounds = 3
 
-    # Measure serial time
-    start = time.perf_counter()
+    # Warm up the allocator and the shared thread pool outside the timed region.
     pylibjxl.encode(img, effort=7)
-    pylibjxl.encode(img, effort=7)
-    serial_time = time.perf_counter() - start
+    await pylibjxl.encode_async(img, effort=7)
+
+    # Timing noise only ever adds time, so compare the best of a few rounds.
+    serial_ns = []
+    for _ in range(rounds):
+        start = time.perf_counter_ns()
+        pylibjxl.encode(img, effort=7)
+        pylibjxl.encode(img, effort=7)
+        serial_ns.append(time.perf_counter_ns() - start)
+
+    concurrent_ns = []
+    for _ in range(rounds):
+        start = time.perf_counter_ns()
+        tasks = [
+            pylibjxl.encode_async(img, effort=7),
+            pylibjxl.encode_async(img, effort=7),
+        ]
+        await asyncio.gather(*tasks)
+        concurrent_ns.append(time.perf_counter_ns() - start)
 
-    # Measure concurrent time
-    start = time.perf_counter()
-    tasks = [pylibjxl.encode_async(img, effort=7), pylibjxl.encode_async(img, effort=7)]
-    await asyncio.gather(*tasks)
-    concurrent_time = time.perf_counter() - start
+    serial_time = min(serial_ns) / 1e9
+    concurrent_time = min(concurrent_ns) / 1e9
 
     print(f"\nSerial time: {serial_time:.4f}s")
     print(f"Concurrent time: {concurrent_time:.4f}s")
@@ -45,3 +60,70 @@ async def test_concurrent_processing(sample_image):
     assert concurrent_time < serial_time * 2.0, (
         f"Concurrent ({concurrent_time:.4f}s) was significantly slower than serial ({serial_time:.4f}s)"
     )
+
+
+@pytest.mark.asyncio
+async def test_async_encode_scales(sample_image):
+    img = sample_image
+    n = 8
+
+    # Warm up the executor thread and the cached encoder/runner, then take the
+    # best of a few timings: noise only ever adds time.
+    await pylibjxl.encode_async(img, effort=3)
+
+    single_ns = []
+    for _ in range(3):
+        start = time.perf_counter_ns()
+        await pylibjxl.encode_async(img, effort=3)
+        single_ns.append(time.perf_counter_ns() - start)
+
+    concurrent_ns = []
+    for _ in range(2):
+        start = time.perf_counter_ns()
+        results = await asyncio.gather(
+            *(pylibjxl.encode_async(img, effort=3) for _ in range(n))
+        )
+        concurrent_ns.append(time.perf_counter_ns() - start)
+
+    single_time = min(single_ns) / 1e9
+    concurrent_time = min(concurrent_ns) / 1e9
+
+    print(f"\nSingle time: {single_time:.4f}s")
+    print(f"{n} concurrent: {concurrent_time:.4f}s")
+
+    assert len(set(results)) == 1
+    # Encodes share one thread pool and take turns on it, each spreading its
+    # work across all cores, so N in flight should cost about N encodes of wall
+    # time. The 2x margin matches the serial/concurrent check above and leaves
+    # room for other test workers sharing the cores (pytest -n auto).
+    assert concurrent_time < n * single_time * 2.0, (
+        f"{n} concurrent encodes ({concurrent_time:.4f}s) took longer than "
+        f"2 x {n} x single ({single_time:.4f}s)"
+    )
+
+
+def test_parallel_encodes(sample_image):
+    img = sample_image
+    n = 8
+
+    with pylibjxl.JXL(effort=3) as jxl:
+        jxl.encode(img)  # warm up the runner and the cached encoder
+
+        start = time.perf_counter()
+        expected = [jxl.encode(img) for _ in range(n)]
+        serial_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=n) as pool:
+            results = list(pool.map(lambda _: jxl.encode(img), range(n)))
+        threaded_time = time.perf_counter() - start
+
+    print(f"\nSerial time: {serial_time:.4f}s")
+    print(f"Threaded time: {threaded_time:.4f}s")
+
+    assert results == expected
+    # Calls on one codec serialize on its lock and each encode is already spread
+    # across cores by the runner, so just ensure contention is not pathological.
+    assert threaded_time < serial_time * 2.0, (
+        f"Threaded ({threaded_time:.4f}s) was significantly slower than serial ({serial_time:.4f}s)"
+    )
@@ -1,15 +1,47 @@
 import asyncio
+import ctypes
+import ctypes.util
 import gc
 import os
+import sys
+import tracemalloc
 
 import psutil
 
 from pylibjxl import AsyncJXL
 
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+_libc_name = ctypes.util.find_library("c")
+_malloc_trim = getattr(ctypes.CDLL(_libc_name), "malloc_trim", None) if _libc_name else None
+
 
 def get_process_memory_mb():
+    # Hand freed arenas back to the OS first (glibc only), so what stays in
+    # RSS is memory that is actually still held rather than allocator slack.
+    if _malloc_trim is not None:
+        _malloc_trim(0)
     process = psutil.Process(os.getpid())
-    return process.memory_info().rss / 1024 / 1024
+    # Leave out tracemalloc's own trace tables, which grow with every live
+    # allocation and would otherwise show up as a leak.
+    return (process.memory_info().rss - tracemalloc.get_tracemalloc_memory()) / 1024 / 1024
+
+
+def get_peak_memory_mb():
+    if resource is None:
+        return float("nan")
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def print_top_allocations(limit=5):
+    """Python-side allocations by line, to tell wrapper leaks from libjxl ones."""
+    for stat in tracemalloc.take_snapshot().statistics("lineno")[:limit]:
+        print(f"    {stat}")
 
 async def stress_test(iterations=100, concurrency=10, threads=4):
     print(f"Starting stress test: {iterations} iterations, {concurrency} concurrent tasks, {threads} runner threads")
@@ -20,37 +52,54 @@ async def stress_test(iterations=100, concurrency=10, threads=4):
     with open(img_path, "rb") as f:
         img_bytes = f.read()
     img = decode_jpeg(img_bytes)
-    print(f"Loaded image {img_path}: {img.shape}")
+    # Every task encodes this one buffer. The encoders take read-only
+    # C-contiguous arrays as-is, so freezing it guarantees no task can
+    # mutate it under another and no per-call copy is made.
+    img.setflags(write=False)
+    print(f"Loaded image {img_path}: {img.shape} at {img.ctypes.data:#x} (read-only, shared)")
     
-    # Initial memory
+    # Initial memory, with tracing already running so the baseline includes it
+    tracemalloc.start(10)
     gc.collect()
     start_mem = get_process_memory_mb()
     print(f"Initial Memory: {start_mem:.2f} MB")
     
     async with AsyncJXL(threads=threads) as runner:
+        # One encode+decode cycle per task, with up to 2x concurrency in flight,
+        # so encodes for later images overlap decodes of earlier ones.
+        slots = asyncio.Semaphore(concurrency * 2)
+        report_every = 50 * concurrency
+        done = 0
+
+        async def one():
+            nonlocal done
+            async with slots:
+                data = await runner.encode_async(img, effort=1)  # Use effort=1 for speed
+                await runner.decode_async(data)
+            done += 1
+            if done % report_every == 0:
+                gc.collect()
+                current_mem = get_process_memory_mb()
+                diff = current_mem - start_mem
+                print(f"Iteration {done // concurrency}: {current_mem:.2f} MB (Delta: {diff:+.2f} MB)")
+                print_top_allocations()
+
         try:
-            for i in range(iterations):
-                tasks = []
-                for _ in range(concurrency):
-                    tasks.append(runner.encode_async(img, effort=1)) # Use effort=1 for speed
-                
-                results = await asyncio.gather(*tasks)
-                
-                # Optional: Decode back to ensure full cycle
-                decode_tasks = [runner.decode_async(data) for data in results]
-                await asyncio.gather(*decode_tasks)
-                
-                if (i + 1) % 50 == 0:
-                    gc.collect()
-                    current_mem = get_process_memory_mb()
-                    diff = current_mem - start_mem
-                    print(f"Iteration {i+1}: {current_mem:.2f} MB (Delta: {diff:+.2f} MB)")
+            await asyncio.gather(*(one() for _ in range(iterations * concurrency)))
         except Exception as e:
             print(f"Error: {e}")
         
     gc.collect()
     end_mem = get_process_memory_mb()
     print(f"Final Memory: {end_mem:.2f} MB (Total Delta: {end_mem - start_mem:+.2f} MB)")
+    print(f"Peak Memory: {get_peak_memory_mb():.2f} MB")
+    tracemalloc.stop()
 
 if __name__ == "__main__":
-    asyncio.run(stress_test())
+    # uvloop, when installed, trims per-task scheduling overhead off the stress loop
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(stress_test())
+    else:
+        uvloop.run(stress_test())